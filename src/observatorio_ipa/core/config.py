@@ -83,6 +83,13 @@ class GoogleSettings(BaseSettings):
             description="Path to the json file with Google account credentials",
         ),
     ]
+    use_high_volume_endpoint: Annotated[
+        bool,
+        Field(
+            description="Connect to the Earth Engine high-volume endpoint. Use only for batch/automated processing, "
+            "interactive requests (e.g. getMapId) should use the default endpoint",
+        ),
+    ] = False
 
 
 class EmailSettings(BaseSettings):
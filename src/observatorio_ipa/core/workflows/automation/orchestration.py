@@ -211,7 +211,10 @@ def auto_job_init(settings: Settings, session: Session) -> str | None:
         runtime_service_account = connections.GoogleServiceAccount(
             settings.app.google.credentials_file.as_posix(),
         )
-        connections.connect_to_gee(runtime_service_account)
+        connections.connect_to_gee(
+            runtime_service_account,
+            use_high_volume_endpoint=settings.app.google.use_high_volume_endpoint,
+        )
 
     except Exception as e:
         error_msg = f"Error connecting to GEE: {e}"
@@ -419,7 +422,10 @@ def auto_orchestration(settings: Settings, session: Session) -> None:
         runtime_service_account = connections.GoogleServiceAccount(
             settings.app.google.credentials_file.as_posix(),
         )
-        connections.connect_to_gee(runtime_service_account)
+        connections.connect_to_gee(
+            runtime_service_account,
+            use_high_volume_endpoint=settings.app.google.use_high_volume_endpoint,
+        )
 
     except Exception as e:
         error_msg = f"Error connecting to GEE: {e}"
@@ -21,6 +21,8 @@ from observatorio_ipa.utils import dates
 
 logger = logging.getLogger(LOGGER_NAME)
 
+GEE_HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
 
 class GoogleServiceAccount:
     """
@@ -50,12 +52,18 @@ class GoogleServiceAccount:
         return service_account_data
 
 
-def connect_to_gee(service_account_: GoogleServiceAccount) -> None:
+def connect_to_gee(
+    service_account_: GoogleServiceAccount, use_high_volume_endpoint: bool = False
+) -> None:
     """
     Initialize the Google Earth Engine (GEE) connection using a service account file.
 
+    The high-volume endpoint is recommended for automated workflows that send many concurrent requests.
+    Interactive usage (e.g. getMapId) should use the default endpoint.
+
     Args:
         service_account_file (str): Path to the service account JSON file.
+        use_high_volume_endpoint (bool): Connect to the GEE high-volume endpoint. Defaults to False.
         email_service: Email service instance for error notifications.
         script_start_time: Start time of the script for logging purposes.
 
@@ -68,7 +76,10 @@ def connect_to_gee(service_account_: GoogleServiceAccount) -> None:
             email=service_account_.service_user,
             key_data=json.dumps(service_account_.credentials),
         )
-        ee.Initialize(credentials=credentials, project=service_account_.project_id)
+        ee_url = GEE_HIGH_VOLUME_URL if use_high_volume_endpoint else None
+        ee.Initialize(
+            credentials=credentials, url=ee_url, project=service_account_.project_id
+        )
 
     except ee_exception.EEException as e:
         logger.error(f"Google Earth Engine connection failed: {e}")
@@ -3,6 +3,7 @@ import logging
 from time import sleep
 import copy
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from ee import batch as ee_batch
 from pathlib import Path
 import prettytable
@@ -417,32 +418,45 @@ class ExportTaskList:
         table.add_rows(rows)
         return table.get_string()
 
-    def start_exports(self) -> dict[str, int]:
+    def start_exports(self, max_workers: int = 4) -> dict[str, int]:
         """
         Start all export tasks.
 
         Process will skip all tasks that are not dictionaries or do not have the required keys.
         required keys: ["task", "image", "target"]
 
+        Tasks are started concurrently since each start is an independent request to GEE. Concurrency is kept low
+        since GEE limits request rates and concurrent requests per project, a task that fails to start because of
+        this is marked FAILED_TO_START.
+
+        Args:
+            max_workers (int): Maximum number of tasks started at the same time. Default is 4.
+
         Returns:
             dict: Summary of export tasks with their Export status.
         """
         logger.debug("Starting export tasks...")
 
         ####### START TASKS #######
+        tasks_to_start = []
         skipped_tasks = 0
-        for i, task in enumerate(self._tasks):
+        for task in self._tasks:
 
             # Skip tasks with "bad" status or mock tasks
             current_status = task.task_status
             if current_status in GEE_TASK_STATUS["NOT_STARTED"]:
-                task.start_task()
+                tasks_to_start.append(task)
             else:
                 skipped_tasks += 1
                 logger.info(
                     f"Skipping task: {task.target} - {task.name} with status {current_status}"
                 )
 
+        # start_task() handles its own errors and only updates its own task
+        if tasks_to_start:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(lambda task: task.start_task(), tasks_to_start))
+
         logger.info(
             f"Started {len(self._tasks) - skipped_tasks} export tasks. Skipped {skipped_tasks} tasks."
         )
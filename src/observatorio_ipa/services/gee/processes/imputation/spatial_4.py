@@ -11,7 +11,11 @@ import ee
 from observatorio_ipa.core.defaults import DEFAULT_CHI_PROJECTION, DEFAULT_SCALE
 
 
-def _ee_impute_tac_spatial4(ee_image: ee.image.Image) -> ee.image.Image:
+def _ee_impute_tac_spatial4(
+    ee_image: ee.image.Image,
+    ee_kernel_w: ee.kernel.Kernel,
+    ee_projection: ee.projection.Projection,
+) -> ee.image.Image:
     """
     Imputes missing TAC values using spatial neighboring pixels if 3 or more neighbors have the same value.
 
@@ -26,6 +30,8 @@ def _ee_impute_tac_spatial4(ee_image: ee.image.Image) -> ee.image.Image:
 
     Args:
         image (ee.image.Image): Image with a 'TAC' and 'QA_RC' bands.
+        ee_kernel_w (ee.kernel.Kernel): 3x3 kernel selecting the 4 neighboring pixels
+        ee_projection (ee.projection.Projection): MODIS projection at the default scale
 
     Returns:
         ee.image.Image: Original image with imputed 'TAC' and 'QA_RC' values.
@@ -36,16 +42,6 @@ def _ee_impute_tac_spatial4(ee_image: ee.image.Image) -> ee.image.Image:
     # ? What's the purpose of adding system:time_start_date?
     # ! Images are being re-projected multiple times, verify if this is necessary
 
-    # Define kernel cells (4 neighboring pixels)
-    weights = [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
-
-    ee_kernel_w = ee.kernel.Kernel.fixed(weights=ee.ee_list.List(weights))
-
-    # Incorporate MODIS projection and adjust scale
-    ee_projection = ee.projection.Projection(DEFAULT_CHI_PROJECTION).atScale(
-        DEFAULT_SCALE
-    )
-
     # ----------IMPUTE TAC----------------
 
     # Reclassify TAC band values, by numbers that do not have a common multiple:
@@ -67,6 +63,7 @@ def _ee_impute_tac_spatial4(ee_image: ee.image.Image) -> ee.image.Image:
     ee_sum_img = ee_TAC_reclassified_img.reduceNeighborhood(
         reducer=ee.reducer.Reducer.sum(),
         kernel=ee_kernel_w,
+        skipMasked=False,
     ).reproject(DEFAULT_CHI_PROJECTION, None, DEFAULT_SCALE)
 
     # keep only pixels where original TAC==0
@@ -81,11 +78,11 @@ def _ee_impute_tac_spatial4(ee_image: ee.image.Image) -> ee.image.Image:
         bandName="TACReclass_sum",
     ).rename("TAC_step_4")
 
-    # Combine original and imputed TAC bands into one image
+    # Replace original TAC (0) with imputed values where the neighbors were evaluated
     ee_new_TAC_img = (
-        ee.image.Image.cat([ee_TAC_original_img, ee_masked_reclass_img])
-        .reduce(ee.reducer.Reducer.max())
+        ee_TAC_original_img.where(ee_masked_reclass_img.mask(), ee_masked_reclass_img)
         .rename("TAC")
+        .toByte()
     )
 
     # ----------UPDATE QA_CR FOR IMPUTED VALUES----------------
@@ -95,19 +92,12 @@ def _ee_impute_tac_spatial4(ee_image: ee.image.Image) -> ee.image.Image:
     # Set QA for points with imputed TAC to 40 where new TAC are >0 to 40
     # Imputed TAC points are those where originally TAC==0 and now TAC>0
     QA_mask = ee_masked_reclass_img.gt(0)
-    QAmasked = ee.image.Image(40).updateMask(QA_mask)  # Between 1 and 40, values 40
 
-    # Join original and imputed QA bands and combine
-    ee_QA_new_img = (
-        ee.image.Image.cat([ee_QA_original_img, QAmasked])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("QA_CR")
-    )
+    ee_QA_new_img = ee_QA_original_img.where(QA_mask, 40).rename("QA_CR").toByte()
 
     return (
-        ee_image.select([])
-        .addBands(ee_new_TAC_img)
-        .addBands(ee_QA_new_img)
+        # Replace TAC and QA_CR in place
+        ee_image.addBands(ee_new_TAC_img.addBands(ee_QA_new_img), overwrite=True)
         .set("DEM_snow_max", None)
         .set("DEM_snow_min", None)
         .set(
@@ -143,6 +133,22 @@ def ic_impute_TAC_spatial4(
 
     """
 
-    ee_imputed_TAC_ic = ee_collection.map(lambda image: _ee_impute_tac_spatial4(image))
+    # Only TAC and QA_CR are used, other bands are dropped before mapping
+    ee_collection = ee_collection.select(["TAC", "QA_CR"])
+
+    # Kernel and projection are the same for all images, built once instead of once per mapped image
+    # Define kernel cells (4 neighboring pixels)
+    weights = [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
+
+    ee_kernel_w = ee.kernel.Kernel.fixed(weights=weights)
+
+    # Incorporate MODIS projection and adjust scale
+    ee_projection = ee.projection.Projection(DEFAULT_CHI_PROJECTION).atScale(
+        DEFAULT_SCALE
+    )
+
+    ee_imputed_TAC_ic = ee_collection.map(
+        lambda image: _ee_impute_tac_spatial4(image, ee_kernel_w, ee_projection)
+    )
 
     return ee_imputed_TAC_ic
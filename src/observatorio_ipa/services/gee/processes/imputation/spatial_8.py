@@ -64,12 +64,12 @@ def _ee_impute_tac_spatial_dem(
         .rename("comparison")  # values [0,100], 100=snow
     )
 
-    # Combine original and imputed TAC bands into one image
+    # Replace original TAC (0) with the comparison values where TAC was missing
     ee_TAC_original_img = image.select("TAC")
     ee_TAC_new_img = (
-        ee.image.Image.cat([ee_TAC_original_img, ee_comparison_img])
-        .reduce(ee.reducer.Reducer.max())
+        ee_TAC_original_img.where(ee_comparison_img.mask(), ee_comparison_img)
         .rename("TAC")
+        .toByte()
     )
 
     # ----------UPDATE QA_CR FOR IMPUTED VALUES----------------
@@ -79,19 +79,11 @@ def _ee_impute_tac_spatial_dem(
     # Set QA for points with imputed TAC to 40 where new TAC are >0 to 40
     # Imputed TAC points are those where originally TAC==0 and now TAC>0
     ee_QA_mask = ee_comparison_img.gt(0)
-    ee_QAmasked_img = ee.image.Image(50).updateMask(ee_QA_mask)
-    # Join original and imputed QA bands and combine
-    ee_QA_new_img = (
-        ee.image.Image.cat([ee_QA_original_img, ee_QAmasked_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("QA_CR")
-    )
+    ee_QA_new_img = ee_QA_original_img.where(ee_QA_mask, 50).rename("QA_CR").toByte()
 
     return (
-        image.select([])
-        .addBands(ee_TAC_new_img)
-        .addBands(ee_QA_new_img)
-        .set(
+        # Replace TAC and QA_CR in place
+        image.addBands(ee_TAC_new_img.addBands(ee_QA_new_img), overwrite=True).set(
             "system:time_start_date",
             ee.ee_date.Date(image.get("system:time_start")).format("YYYY_MM_dd"),
         )
@@ -1,14 +1,46 @@
 import ee
-from observatorio_ipa.core.defaults import MILLISECONDS_IN_DAY
+from observatorio_ipa.core.defaults import DEFAULT_SCALE, MILLISECONDS_IN_DAY
 
 TEMPORAL_11_QA_VALUE = 20
 TEMPORAL_21_QA_VALUE = 21
 TEMPORAL_12_QA_VALUE = 22
 
 
+def _ee_get_neighbor_image(
+    ee_image: ee.image.Image,
+    property_name: str,
+    ee_fallback_img: ee.image.Image,
+    band_name: str,
+) -> ee.image.Image:
+    """
+    (Server Side Function) Gets the neighbor TAC image saved in a property of the image or the fallback image.
+
+    The neighbor property is null when the date doesn't exist, in that case the fallback image is used. Masked
+    pixels of an existing image are filled with 0 with unmask(), same result as mosaicking over the fallback image.
+
+    args:
+        ee_image (ee.image.Image): Image with the neighbor image saved as a property
+        property_name (str): Name of the property with the neighbor image
+        ee_fallback_img (ee.image.Image): TAC image with value 0 used when the neighbor image doesn't exist
+        band_name (str): New name for the TAC band
+
+    returns:
+        ee.image.Image: Single band image with the neighbor TAC values
+    """
+    ee_candidate_img = ee_image.get(property_name)
+
+    return (
+        ee.image.Image(
+            ee.Algorithms.If(ee_candidate_img, ee_candidate_img, ee_fallback_img)
+        )
+        .unmask(0, False)
+        .rename(band_name)
+    )
+
+
 def _ee_impute_tac_temporal(
     ee_image: ee.image.Image,
-    ee_reference_ic: ee.imagecollection.ImageCollection,
+    ee_fallback_img: ee.image.Image,
 ):
     """
     (Server Side Function) Imputes missing TAC values from specific leading and trailing images in a timeseries.
@@ -17,240 +49,173 @@ def _ee_impute_tac_temporal(
     New values need to be >0 and equal in the leading and trailing images, otherwise keeps the original value.
     The function also updates the QA band with a value where TAC values were successfully imputed.
 
-    If the parameter ee_collection is provided these images are used to get the target image whose pixel values
-    need to be imputed. Leading and trailing images for imputation are always taken from the original ee_reference_ic collection.
+    Buffers are evaluated in order of priority -1/+1 (QA=20), -2/+1 (QA=21) and -1/+2 (QA=22). A lower priority
+    buffer is only used for pixels that were not imputed by a higher priority one.
 
-    If no ee_collection is provided, the reference collection is used for both the target image and the leading
-    and trailing images.
+    Leading and trailing images are read from the trailing_1, trailing_2, leading_1 and leading_2 properties
+    attached to the image by _ee_join_neighbor_image().
 
     leading and trailing buffer dates are relative to the date of the image under evaluation.
 
     args:
-        ee_image (ee.image.Image): Image with TAC and QA_CR bands to be imputed
-        ee_reference_ic (ee.imagecollection.ImageCollection): Image collection with Original TAC and QA_CR bands
-        qa_value (int): Value to set in the QA band where TAC values were successfully imputed
-        trail_buffer (int): Number of days to move back to select the trailing image
-        lead_buffer (int): Number of days to move forward to select the leading image.
+        ee_image (ee.image.Image): Image with TAC and QA_CR bands to be imputed and the neighbor image properties
+        ee_fallback_img (ee.image.Image): TAC image with value 0 used when a leading or trailing image doesn't exist
 
     returns:
         ee.image.Image: Image with the new TAC and QA bands
 
     """
 
-    # ---- CALC REFERENCE DATES -----
-    ee_target_dt = ee.ee_number.Number(ee_image.get("system:time_start"))
-
-    ee_trailing_1_dt = ee_target_dt.subtract(1 * MILLISECONDS_IN_DAY)
-    ee_leading_1_dt = ee_target_dt.add(1 * MILLISECONDS_IN_DAY)
-    ee_trailing_2_dt = ee_target_dt.subtract(2 * MILLISECONDS_IN_DAY)
-    ee_leading_2_dt = ee_target_dt.add(2 * MILLISECONDS_IN_DAY)
-
     # ---- GET REFERENCE IMAGES -----
     ee_target_img = ee_image  # Changing var name just for clarity
 
-    # Adding Fallback images in case the image date doesn't exist in the collection.
-    ee_fallback_img = ee.image.Image.constant(0).rename("TAC").toByte()
-
     ####### TRAILING IMAGES or FALLBACK #########
-    # Trailing 1 day
-    ee_candidate_trailing_1_img = ee.image.Image(
-        ee_reference_ic.select(["TAC"]).filterDate(ee_trailing_1_dt).first()
-    )
-
-    ee_trailing_1_img = ee.image.Image(
-        ee.imagecollection.ImageCollection(
-            [
-                ee_fallback_img,
-                ee_candidate_trailing_1_img,
-            ]
-        )
-        .mosaic()
-        .set("system:time_start", ee_trailing_1_dt)
-    )
-
-    ee_trailing_1_img = ee_trailing_1_img.rename("trailing_TAC")
-
-    # Trailing 2 days
-    ee_candidate_trailing_2_img = ee.image.Image(
-        ee_reference_ic.select(["TAC"]).filterDate(ee_trailing_2_dt).first()
+    ee_trailing_1_img = _ee_get_neighbor_image(
+        ee_image, "trailing_1", ee_fallback_img, "trailing_TAC"
     )
-
-    ee_trailing_2_img = ee.image.Image(
-        ee.imagecollection.ImageCollection(
-            [
-                ee_fallback_img,
-                ee_candidate_trailing_2_img,
-            ]
-        )
-        .mosaic()
-        .set("system:time_start", ee_trailing_2_dt)
+    ee_trailing_2_img = _ee_get_neighbor_image(
+        ee_image, "trailing_2", ee_fallback_img, "trailing_TAC"
     )
 
-    ee_trailing_2_img = ee_trailing_2_img.rename("trailing_TAC")
-
     ####### LEADING IMAGES or FALLBACK #########
-    # Leading 1 day
-
-    ee_candidate_leading_1_img = ee.image.Image(
-        ee_reference_ic.select(["TAC"]).filterDate(ee_leading_1_dt).first()
+    ee_leading_1_img = _ee_get_neighbor_image(
+        ee_image, "leading_1", ee_fallback_img, "leading_TAC"
     )
-
-    ee_leading_1_img = ee.image.Image(
-        ee.imagecollection.ImageCollection(
-            [
-                ee_fallback_img,
-                ee_candidate_leading_1_img,
-            ]
-        )
-        .mosaic()
-        .set("system:time_start", ee_leading_1_dt)
-    )
-    ee_leading_1_img = ee_leading_1_img.rename("leading_TAC")
-
-    # Leading 2 days
-    ee_candidate_leading_2_img = ee.image.Image(
-        ee_reference_ic.select(["TAC"]).filterDate(ee_leading_2_dt).first()
-    )
-    ee_leading_2_img = ee.image.Image(
-        ee.imagecollection.ImageCollection(
-            [
-                ee_fallback_img,
-                ee_candidate_leading_2_img,
-            ]
-        )
-        .mosaic()
-        .set("system:time_start", ee_leading_2_dt)
+    ee_leading_2_img = _ee_get_neighbor_image(
+        ee_image, "leading_2", ee_fallback_img, "leading_TAC"
     )
-    ee_leading_2_img = ee_leading_2_img.rename("leading_TAC")
 
     ####### CALC TAC AND QA VALUES #########
-    # ----- CALC NEW TAC for -1/+1 days-----
+    # The three imputation passes (-1/+1, -2/+1, -1/+2) are evaluated in a single pass. A pass can only fill
+    # pixels that are still TAC==0 after the previous passes, which is the same as applying them in reverse
+    # priority order with where(), letting the highest priority pass (-1/+1) overwrite the others.
     ee_original_tac_img = ee_target_img.select("TAC")
+    ee_original_QA_img = ee_target_img.select("QA_CR")
 
-    # Keep TAC values from leading and Trailing images where original target Image had TAC==0 (missing)
-    ee_11_mask_t0 = ee_original_tac_img.eq(0)
-    ee_11_masked_trailing_1_img = ee_trailing_1_img.updateMask(ee_11_mask_t0)
-    ee_11_masked_leading_1_img = ee_leading_1_img.updateMask(ee_11_mask_t0)
+    # Only pixels where original target Image had TAC==0 (missing) can be imputed
+    ee_mask_t0 = ee_original_tac_img.eq(0)
 
     # Identify points from Trailing and leading images where TAC values are the same and TAC>0
-    ee_11_matching_tac_mask_img = ee_11_masked_trailing_1_img.eq(
-        ee_11_masked_leading_1_img
-    ).updateMask(ee_11_masked_trailing_1_img.gt(0))
-
-    ee_11_imputed_tac_img = ee_11_masked_trailing_1_img.updateMask(
-        ee_11_matching_tac_mask_img
+    # The three buffer pairs are stacked as bands so the comparison and the TAC==0 mask are applied only once.
+    ee_trailing_img = ee.image.Image.cat(
+        [ee_trailing_1_img, ee_trailing_2_img, ee_trailing_1_img]
+    ).rename(["TAC_11", "TAC_21", "TAC_12"])
+    ee_leading_img = ee.image.Image.cat(
+        [ee_leading_1_img, ee_leading_1_img, ee_leading_2_img]
+    ).rename(["TAC_11", "TAC_21", "TAC_12"])
+
+    ee_matching_tac_mask_img = (
+        ee_trailing_img.eq(ee_leading_img).And(ee_trailing_img.gt(0)).And(ee_mask_t0)
     )
-
-    ee_11_new_tac_img = (
-        ee.image.Image.cat([ee_original_tac_img, ee_11_imputed_tac_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_TAC")
+    ee_11_matching_tac_mask_img = ee_matching_tac_mask_img.select("TAC_11")
+    ee_21_matching_tac_mask_img = ee_matching_tac_mask_img.select("TAC_21")
+    ee_12_matching_tac_mask_img = ee_matching_tac_mask_img.select("TAC_12")
+
+    # ----- CALC NEW TAC -----
+    # Imputed value is the trailing value since trailing and leading values are the same
+    ee_new_tac_img = (
+        ee_original_tac_img.where(ee_12_matching_tac_mask_img, ee_trailing_1_img)
+        .where(ee_21_matching_tac_mask_img, ee_trailing_2_img)
+        .where(ee_11_matching_tac_mask_img, ee_trailing_1_img)
+        .rename("TAC")
+        .toByte()
     )
 
-    # ------ CALC NEW QC for -1/+1 days -----
-    ee_original_QA_img = ee_target_img.select("QA_CR")
-
+    # ------ CALC NEW QC -----
     # Update QA band with new value where TAC values were successfully imputed
-    ee_11_imputed_qa_img = ee.image.Image(TEMPORAL_11_QA_VALUE).updateMask(
-        ee_11_matching_tac_mask_img
-    )
-    ee_new_11_qa_img = (
-        ee.image.Image.cat([ee_original_QA_img, ee_11_imputed_qa_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_QA_CR")
+    ee_new_qa_img = (
+        ee_original_QA_img.where(ee_12_matching_tac_mask_img, TEMPORAL_12_QA_VALUE)
+        .where(ee_21_matching_tac_mask_img, TEMPORAL_21_QA_VALUE)
+        .where(ee_11_matching_tac_mask_img, TEMPORAL_11_QA_VALUE)
+        .rename("QA_CR")
+        .toByte()
     )
 
-    ee_11_new_img = (
-        ee_target_img.addBands(ee_11_new_tac_img)
-        .addBands(ee_new_11_qa_img)
-        .select(["New_TAC", "New_QA_CR"], ["TAC", "QA_CR"])
+    return (
+        # Replace TAC and QA_CR in place
+        ee_target_img.addBands(ee_new_tac_img.addBands(ee_new_qa_img), overwrite=True)
+        .set("trailing_1", None)
+        .set("trailing_2", None)
+        .set("leading_1", None)
+        .set("leading_2", None)
     )
 
-    # ----- CALC NEW TAC for -2/+1 days-----
-    # Keep TAC values from leading and Trailing images where new imputed image has TAC==0 (missing)
-    ee_21_mask_t0 = ee_11_new_img.select("TAC").eq(
-        0
-    )  # start with the new TAC image from -1/+1 imputation
-    ee_21_masked_trailing_2_img = ee_trailing_2_img.updateMask(ee_21_mask_t0)
-    ee_21_masked_leading_1_img = ee_leading_1_img.updateMask(ee_21_mask_t0)
 
-    # Identify points from Trailing and leading images where TAC values are the same and TAC>0
-    ee_21_matching_tac_mask_img = ee_21_masked_trailing_2_img.eq(
-        ee_21_masked_leading_1_img
-    ).updateMask(ee_21_masked_trailing_2_img.gt(0))
+def _ee_join_neighbor_image(
+    ee_collection: ee.imagecollection.ImageCollection,
+    ee_reference_ic: ee.imagecollection.ImageCollection,
+    days: int,
+    property_name: str,
+) -> ee.imagecollection.ImageCollection:
+    """
+    (Server Side Function) Attaches to each image the reference TAC image from a number of days apart.
 
-    ee_21_imputed_tac_img = ee_21_masked_trailing_2_img.updateMask(
-        ee_21_matching_tac_mask_img
-    )
+    The reference collection is shifted in time so the neighbor's date matches the target's date and is joined
+    to the collection with an equality filter. Images without a neighbor are kept and the property is not set.
 
-    ee_21_new_tac_img = (
-        ee.image.Image.cat([ee_11_new_img.select("TAC"), ee_21_imputed_tac_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_TAC")
-    )
+    args:
+        ee_collection (ee.imagecollection.ImageCollection): Image collection to attach the neighbor images to
+        ee_reference_ic (ee.imagecollection.ImageCollection): Image collection with Original TAC band
+        days (int): Days from the target image to the neighbor image, negative for trailing images
+        property_name (str): Name of the property where the neighbor image is saved
 
-    # ------ CALC NEW QC for -2/+1 days -----
-    # Update QA band with new value where TAC values were successfully imputed
-    ee_21_imputed_qa_img = ee.image.Image(TEMPORAL_21_QA_VALUE).updateMask(
-        ee_21_matching_tac_mask_img
-    )
-    ee_21_new_qa_img = (
-        ee.image.Image.cat([ee_11_new_img.select("QA_CR"), ee_21_imputed_qa_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_QA_CR")
-    )
+    returns:
+        ee.imagecollection.ImageCollection: Image collection with the neighbor image as a property
+    """
 
-    ee_new_21_img = (
-        ee_11_new_img.addBands(ee_21_new_tac_img)
-        .addBands(ee_21_new_qa_img)
-        .select(["New_TAC", "New_QA_CR"], ["TAC", "QA_CR"])
+    ee_shifted_ic = ee_reference_ic.select(["TAC"]).map(
+        lambda ee_image: ee_image.set(
+            "neighbor_time_start",
+            ee.ee_number.Number(ee_image.get("system:time_start")).subtract(
+                days * MILLISECONDS_IN_DAY
+            ),
+        )
     )
 
-    # ----- CALC NEW TAC for -1/+2 days-----
-    # Keep TAC values from leading and Trailing images where new imputed image has TAC==0 (missing)
-    ee_12_mask_t0 = ee_new_21_img.select("TAC").eq(
-        0
-    )  # start with the new TAC image from -2/+1 imputation
-    ee_12_masked_trailing_1_img = ee_trailing_1_img.updateMask(ee_12_mask_t0)
-    ee_12_masked_leading_2_img = ee_leading_2_img.updateMask(ee_12_mask_t0)
-
-    # Identify points from Trailing and leading images where TAC values are the same and TAC>0
-    ee_12_matching_tac_mask_img = ee_12_masked_trailing_1_img.eq(
-        ee_12_masked_leading_2_img
-    ).updateMask(ee_12_masked_trailing_1_img.gt(0))
-
-    ee_12_imputed_tac_img = ee_12_masked_trailing_1_img.updateMask(
-        ee_12_matching_tac_mask_img
+    ee_join = ee.join.Join.saveFirst(matchKey=property_name, outer=True)
+    ee_filter = ee.filter.Filter.equals(
+        leftField="system:time_start", rightField="neighbor_time_start"
     )
 
-    ee_12_new_tac_img = (
-        ee.image.Image.cat([ee_new_21_img.select("TAC"), ee_12_imputed_tac_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_TAC")
+    return ee.imagecollection.ImageCollection(
+        ee_join.apply(ee_collection, ee_shifted_ic, ee_filter)
     )
 
-    # ------ CALC NEW QC for -2/+1 days -----
-    # Update QA band with new value where TAC values were successfully imputed
-    ee_12_imputed_qa_img = ee.image.Image(TEMPORAL_12_QA_VALUE).updateMask(
-        ee_12_matching_tac_mask_img
-    )
-    ee_12_new_qa_img = (
-        ee.image.Image.cat([ee_new_21_img.select("QA_CR"), ee_12_imputed_qa_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_QA_CR")
-    )
 
-    ee_12_new_img = (
-        ee_new_21_img.addBands(ee_12_new_tac_img)
-        .addBands(ee_12_new_qa_img)
-        .select(["New_TAC", "New_QA_CR"], ["TAC", "QA_CR"])
-    )
+def _ee_set_has_gaps(
+    ee_image: ee.image.Image, ee_aoi_geom: ee.geometry.Geometry, parallel_scale: int = 1
+) -> ee.image.Image:
+    """
+    (Server Side Function) Sets property 'has_gaps' to 1 if the image has any TAC==0 (missing) pixel in the AOI.
 
-    return ee_12_new_img
+    args:
+        ee_image (ee.image.Image): Image with TAC band
+        ee_aoi_geom (ee.geometry.Geometry): Geometry of the area of interest
+        parallel_scale (int): parallelScale passed to reduceRegion. Defaults to 1.
+
+    returns:
+        ee.image.Image: Image with the 'has_gaps' property
+    """
+    ee_has_gaps = (
+        ee_image.select("TAC")
+        .eq(0)
+        .reduceRegion(
+            reducer=ee.reducer.Reducer.anyNonZero(),
+            geometry=ee_aoi_geom,
+            scale=DEFAULT_SCALE,
+            maxPixels=1e9,
+            parallelScale=parallel_scale,
+        )
+        .get("TAC")
+    )
+    return ee_image.set("has_gaps", ee_has_gaps)
 
 
 def ic_impute_tac_temporal(
     ee_collection: ee.imagecollection.ImageCollection,
+    ee_aoi_fc: ee.featurecollection.FeatureCollection | None = None,
+    parallel_scale: int = 1,
+    skip_gap_free: bool = False,
 ) -> ee.imagecollection.ImageCollection:
     """
     Imputes missing TAC values from leading and trailing images in a timeseries.
@@ -261,20 +226,66 @@ def ic_impute_tac_temporal(
     The function will only impute TAC values where the target image has the required leading and trailing images.
     2 days before and 2 days after the target image are required.
 
+    If skip_gap_free is True and an area of interest is provided, images without TAC==0 pixels inside it are
+    returned unchanged instead of imputed. The check is an extra region reduction per image, so it only pays off
+    when many images have no missing values. Off by default.
 
     args:
         ee_collection (ee.imagecollection.ImageCollection): Image collection with Original TAC and QA_CR bands
+        ee_aoi_fc (ee.featurecollection.FeatureCollection | None): Area of interest used to skip images without
+            missing TAC values. Only used if skip_gap_free is True. Defaults to None.
+        parallel_scale (int): parallelScale used when checking images for missing TAC values. Higher values
+            use less memory per tile. Defaults to 1.
+        skip_gap_free (bool): Skip imputation of images without missing TAC values in the area of interest.
+            Defaults to False (impute all images).
 
     returns:
     """
 
+    # Only TAC and QA_CR are used, other bands are dropped before mapping
+    ee_collection = ee_collection.select(["TAC", "QA_CR"])
+
+    # Fallback image in case the leading or trailing image date doesn't exist in the collection.
+    # Built once for the whole collection instead of once per mapped image.
+    ee_fallback_img = ee.image.Image.constant(0).rename("TAC").toByte()
+
+    # Skip images that don't have missing TAC values, they are merged back after imputation
+    ee_to_impute_ic = ee_collection
+    ee_passthrough_ic = None
+    if skip_gap_free and ee_aoi_fc is not None:
+        ee_aoi_geom = ee_aoi_fc.geometry()
+        ee_gaps_ic = ee_collection.map(
+            lambda ee_image: _ee_set_has_gaps(ee_image, ee_aoi_geom, parallel_scale)
+        )
+        ee_has_gaps_filter = ee.filter.Filter.eq("has_gaps", 1)
+        ee_to_impute_ic = ee_gaps_ic.filter(ee_has_gaps_filter)
+        ee_passthrough_ic = ee_gaps_ic.filter(ee_has_gaps_filter.Not())
+
+    # Neighbors are attached once with joins instead of filtering the collection for every mapped image
+    # Neighbors are always taken from the full collection
+    ee_joined_ic = ee_to_impute_ic
+    for days, property_name in [
+        (-1, "trailing_1"),
+        (-2, "trailing_2"),
+        (1, "leading_1"),
+        (2, "leading_2"),
+    ]:
+        ee_joined_ic = _ee_join_neighbor_image(
+            ee_joined_ic, ee_collection, days, property_name
+        )
+
     ee_temporal_imputed_ic = ee.imagecollection.ImageCollection(
-        ee_collection.map(
+        ee_joined_ic.map(
             lambda ee_image: _ee_impute_tac_temporal(
                 ee_image=ee_image,
-                ee_reference_ic=ee_collection,
+                ee_fallback_img=ee_fallback_img,
             )
         )
     )
 
+    if ee_passthrough_ic is not None:
+        ee_temporal_imputed_ic = ee_temporal_imputed_ic.merge(ee_passthrough_ic).sort(
+            "system:time_start"
+        )
+
     return ee_temporal_imputed_ic
@@ -7,6 +7,7 @@ def _ee_impute_tac_temporal(
     # ee_date: ee.ee_date.Date,
     qa_value: int,
     ee_reference_ic: ee.imagecollection.ImageCollection,
+    ee_fallback_img: ee.image.Image,
     trail_buffer: int = 1,
     lead_buffer: int = 1,
 ):
@@ -28,6 +29,7 @@ def _ee_impute_tac_temporal(
     args:
         ee_image (ee.image.Image): Image with TAC and QA_CR bands to be imputed
         ee_reference_ic (ee.imagecollection.ImageCollection): Image collection with Original TAC and QA_CR bands
+        ee_fallback_img (ee.image.Image): TAC image with value 0 used when a leading or trailing image doesn't exist
         qa_value (int): Value to set in the QA band where TAC values were successfully imputed
         trail_buffer (int): Number of days to move back to select the trailing image
         lead_buffer (int): Number of days to move forward to select the leading image.
@@ -40,63 +42,57 @@ def _ee_impute_tac_temporal(
     # ---- CALC REFERENCE DATES -----
     ee_target_dt = ee.ee_number.Number(ee_image.get("system:time_start"))
 
-    ee_trailing_dt = ee_target_dt.subtract(
-        ee.ee_number.Number(trail_buffer).multiply(MILLISECONDS_IN_DAY)
-    )
-    ee_leading_dt = ee_target_dt.add(
-        ee.ee_number.Number(lead_buffer).multiply(MILLISECONDS_IN_DAY)
-    )
+    # Buffers are constant for the whole collection, offsets are calculated client side
+    ee_trailing_dt = ee_target_dt.subtract(trail_buffer * MILLISECONDS_IN_DAY)
+    ee_leading_dt = ee_target_dt.add(lead_buffer * MILLISECONDS_IN_DAY)
 
     # ---- GET REFERENCE IMAGES -----
     ee_target_img = ee_image  # Changing var name just for clarity
 
-    # Adding Fallback images in case the image date doesn't exist in the collection.
-    ee_fallback_img = ee.image.Image.constant(0).rename("TAC").toByte()
-
     # Get trailing image or fallback image if not found
     ee_candidate_trailing_img = ee.image.Image(
-        ee_reference_ic.select(["TAC"]).filterDate(ee_trailing_dt).first()
+        ee_reference_ic.select(["TAC"])
+        .filter(ee.filter.Filter.eq("system:time_start", ee_trailing_dt))
+        .first()
     )
 
-    ee_trailing_img = ee.image.Image(
-        ee.imagecollection.ImageCollection(
-            [
-                ee_fallback_img,
-                ee_candidate_trailing_img,
-            ]
+    ee_trailing_img = (
+        ee.image.Image(
+            ee.Algorithms.If(
+                ee_candidate_trailing_img, ee_candidate_trailing_img, ee_fallback_img
+            )
         )
-        .mosaic()
-        .set("system:time_start", ee_trailing_dt)
+        .unmask(0, False)
+        .rename("trailing_TAC")
     )
 
-    ee_trailing_img = ee_trailing_img.rename("trailing_TAC")
-
     # Get leading image or fallback image if not found
 
     ee_candidate_leading_img = ee.image.Image(
-        ee_reference_ic.select(["TAC"]).filterDate(ee_leading_dt).first()
+        ee_reference_ic.select(["TAC"])
+        .filter(ee.filter.Filter.eq("system:time_start", ee_leading_dt))
+        .first()
     )
 
-    ee_leading_img = ee.image.Image(
-        ee.imagecollection.ImageCollection(
-            [
-                ee_fallback_img,
-                ee_candidate_leading_img,
-            ]
+    ee_leading_img = (
+        ee.image.Image(
+            ee.Algorithms.If(
+                ee_candidate_leading_img, ee_candidate_leading_img, ee_fallback_img
+            )
         )
-        .mosaic()
-        .set("system:time_start", ee_leading_dt)
+        .unmask(0, False)
+        .rename("leading_TAC")
     )
 
-    ee_leading_img = ee_leading_img.rename("leading_TAC")
-
     # ----- CALC NEW TAC -----
     ee_original_tac_img = ee_target_img.select("TAC")
 
     # Keep TAC values from leading and Trailing images where original target Image had TAC==0 (missing)
+    # Trailing and leading are masked together as one 2 band image
     ee_mask_t0 = ee_original_tac_img.eq(0)
-    ee_masked_trailing_img = ee_trailing_img.updateMask(ee_mask_t0)
-    ee_masked_leading_img = ee_leading_img.updateMask(ee_mask_t0)
+    ee_masked_tl_img = ee_trailing_img.addBands(ee_leading_img).updateMask(ee_mask_t0)
+    ee_masked_trailing_img = ee_masked_tl_img.select("trailing_TAC")
+    ee_masked_leading_img = ee_masked_tl_img.select("leading_TAC")
 
     # Identify points from Trailing and leading images where TAC values are the same and TAC>0
     ee_matching_tac_mask_img = ee_masked_trailing_img.eq(
@@ -105,27 +101,26 @@ def _ee_impute_tac_temporal(
 
     ee_imputed_tac_img = ee_masked_trailing_img.updateMask(ee_matching_tac_mask_img)
 
+    # Original TAC is 0 where values are imputed, imputed values replace it directly
     ee_new_tac_img = (
-        ee.image.Image.cat([ee_original_tac_img, ee_imputed_tac_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_TAC")
+        ee_original_tac_img.where(ee_imputed_tac_img.mask(), ee_imputed_tac_img)
+        .rename("TAC")
+        .toByte()
     )
 
     # ------ CALC NEW QC -----
     ee_original_QA_img = ee_target_img.select("QA_CR")
 
     # Update QA band with new value where TAC values were successfully imputed
-    ee_imputed_qa_img = ee.image.Image(qa_value).updateMask(ee_matching_tac_mask_img)
     ee_new_qa_img = (
-        ee.image.Image.cat([ee_original_QA_img, ee_imputed_qa_img])
-        .reduce(ee.reducer.Reducer.max())
-        .rename("New_QA_CR")
+        ee_original_QA_img.where(ee_matching_tac_mask_img, qa_value)
+        .rename("QA_CR")
+        .toByte()
     )
 
     return (
-        ee_target_img.addBands(ee_new_tac_img)
-        .addBands(ee_new_qa_img)
-        .select(["New_TAC", "New_QA_CR"], ["TAC", "QA_CR"])
+        # Replace TAC and QA_CR in place
+        ee_target_img.addBands(ee_new_tac_img.addBands(ee_new_qa_img), overwrite=True)
     )
 
 
@@ -150,6 +145,13 @@ def ic_impute_tac_temporal(
     # - Original code kept all images except buffers but was processing full range (2013-Current year)
     # - Current code should keep all images, unnecessary buffers will be filtered when calculating monthly or yearly means
 
+    # Only TAC and QA_CR are used, other bands are dropped before mapping
+    ee_collection = ee_collection.select(["TAC", "QA_CR"])
+
+    # Fallback image in case the leading or trailing image date doesn't exist in the collection.
+    # Built once for the whole collection instead of once per mapped image.
+    ee_fallback_img = ee.image.Image.constant(0).rename("TAC").toByte()
+
     #####################################
     #    Impute values from days -1/+1  #
     #####################################
@@ -160,6 +162,7 @@ def ic_impute_tac_temporal(
             lambda ee_image: _ee_impute_tac_temporal(
                 ee_image=ee_image,
                 ee_reference_ic=ee_collection,
+                ee_fallback_img=ee_fallback_img,
                 qa_value=20,
                 trail_buffer=1,
                 lead_buffer=1,
@@ -177,6 +180,7 @@ def ic_impute_tac_temporal(
             lambda ee_image: _ee_impute_tac_temporal(
                 ee_image=ee_image,
                 ee_reference_ic=ee_collection,
+                ee_fallback_img=ee_fallback_img,
                 qa_value=21,
                 trail_buffer=2,
                 lead_buffer=1,
@@ -193,6 +197,7 @@ def ic_impute_tac_temporal(
             lambda ee_image: _ee_impute_tac_temporal(
                 ee_image=ee_image,
                 ee_reference_ic=ee_collection,
+                ee_fallback_img=ee_fallback_img,
                 qa_value=22,
                 trail_buffer=1,
                 lead_buffer=2,
@@ -39,43 +39,46 @@ def _ee_calculate_TAC(image: ee.image.Image) -> ee.image.Image:
     Returns:
         ee.image.Image: Image with a new 'TAC' and 'QA_CR' bands added.
     """
-    # ? Why is reproject only used here to to use specific scale and projection
+    # Intermediate images are not reprojected, spatial imputation and exports set the projection and scale
+    # they need. See https://developers.google.com/earth-engine/guides/best_practices
+    # The MODIS grid is only set as the default projection (metadata) so the empty band added for missing
+    # Terra or Aqua dates doesn't change the projection of the result.
     # ? Most likely 'Only Terra' really means that Terra>Aqua, and 'Only Aqua' means Aqua>Terra.
     # ? Both means Terra==Aqua.
-    #! There seems to be an error here, the resulting image is not including the TAC band only QA_CR.
+
+    # A masked band counts as 0 as long as the other band has data, pixels with no data in both bands stay masked
+    ee_TA_img = image.select(["LandCover_T", "LandCover_A"])
+    ee_TA_mask = ee_TA_img.mask().reduce(ee.reducer.Reducer.max())
+    ee_TA_img = ee_TA_img.unmask(0, False)
+    ee_TA_bands = {
+        "T": ee_TA_img.select("LandCover_T"),
+        "A": ee_TA_img.select("LandCover_A"),
+    }
 
     # ------- CALCULATE COMBINED TAC -------
     # Calculate the TAC by taking the maximum value between 'LandCover_T' and 'LandCover_A'
     ee_TAC_img = (
-        image.select(["LandCover_T", "LandCover_A"])
-        .reduce(ee.reducer.Reducer.max())
+        ee_TA_img.expression("max(T, A)", ee_TA_bands)
+        .updateMask(ee_TA_mask)
         .rename("TAC")
-        .reproject(DEFAULT_CHI_PROJECTION, None, DEFAULT_SCALE)
     )
 
     # ------ CALCULATE QA FROM TAC VALUE ------
-    # Categoría sumatoria                 Valores banda QA
-    # 1) Solo Terra                       500, 1000 y 1050 -> (10)
-    # 2) Solo Aqua                          50, 100 y 600  -> (11)
-    # 3) Ambos                              0, 550 y 1100  -> (12)
-
-    # Combine the Terra and Aqua bands into a single image. Multiply Terra by 10
-    ee_terra_temp_img = image.select("LandCover_T").multiply(10)
-    ee_aqua_temp_img = image.select("LandCover_A")
-    ee_TA_img = ee.image.Image.cat([ee_terra_temp_img, ee_aqua_temp_img])
-
-    # Sum the values of the Terra and Aqua bands
-    ee_QA_sum_img = ee_TA_img.reduce(ee.reducer.Reducer.sum()).rename("QA_sum")
-
-    # Remap the values of the QA band to recode the values
-    ee_QA_img = ee_QA_sum_img.remap(
-        [0, 50, 100, 500, 550, 600, 1000, 1050, 1100],  # Original values in QA Band
-        [12, 11, 11, 10, 12, 11, 10, 10, 12],  # Remapped values in QA band
-        None,
-        "QA_sum",
-    ).rename("QA_CR")
+    # Categoría                           Valores banda QA
+    # 1) Solo Terra (Terra > Aqua)        (10)
+    # 2) Solo Aqua  (Aqua > Terra)        (11)
+    # 3) Ambos      (Terra == Aqua)       (12)
+    ee_QA_img = (
+        ee_TA_img.expression("T > A ? 10 : (A > T ? 11 : 12)", ee_TA_bands)
+        .updateMask(ee_TA_mask)
+        .rename("QA_CR")
+    )
 
-    return image.addBands(ee_TAC_img).addBands(ee_QA_img).select(["TAC", "QA_CR"])
+    # select() is only used to drop the LandCover bands and keep the image properties
+    ee_TAC_QA_img = ee.image.Image.cat([ee_TAC_img, ee_QA_img]).setDefaultProjection(
+        DEFAULT_CHI_PROJECTION, None, DEFAULT_SCALE
+    )
+    return image.addBands(ee_TAC_QA_img).select(["TAC", "QA_CR"])
 
 
 def _ee_add_missing_band(image: ee.image.Image, band: str) -> ee.image.Image:
@@ -89,10 +92,36 @@ def _ee_add_missing_band(image: ee.image.Image, band: str) -> ee.image.Image:
         ee.image.Image: Original Image with the new band added
     """
 
-    # New image with all pixels set to 0
-    ee_new_band_img_tmp = ee.image.Image().rename(band)
-    # ee_new_band_img = ee.image.Image([ee_new_band_img_tmp]) # Removed, redundant
-    return image.addBands(ee_new_band_img_tmp)
+    # New byte band with all pixels set to 0, limited to the footprint of the image
+    ee_new_band_img = (
+        ee.image.Image.constant(0).toByte().rename(band).updateMask(image.mask())
+    )
+    return image.addBands(ee_new_band_img)
+
+
+def _ee_add_joined_band(
+    image: ee.image.Image, match_key: str, band: str
+) -> ee.image.Image:
+    """EE function that adds the bands of the image saved in a join property, or a new band if there was no match.
+
+    args:
+        image (ee.image.Image): Image with the joined image saved in property match_key
+        match_key (str): Name of the property with the joined image
+        band (str): Name of the band to add if there is no joined image
+
+    returns:
+        ee.image.Image: Original Image with the joined (or new) band added
+    """
+
+    ee_match = image.get(match_key)
+    ee_new_img = ee.image.Image(
+        ee.Algorithms.If(
+            ee_match,
+            image.addBands(ee.image.Image(ee_match)),
+            _ee_add_missing_band(image, band=band),
+        )
+    )
+    return ee_new_img.set(match_key, None)
 
 
 def merge(
@@ -135,48 +164,37 @@ def merge(
 
     # -------- JOIN COLLECTIONS --------#
     # (1) Join ImageCollections by 'system:time_start'
-    # See https://developers.google.com/earth-engine/guides/joins_inner for reference
-    ee_innerJoin = ee.join.Join.inner()
+    # All Terra (MOD) images are kept and the Aqua (MYD) image with the same date is saved as a property.
     ee_filterTimeEq = ee.filter.Filter.equals(
         leftField="system:time_start", rightField="system:time_start"
     )
-
-    ee_MCD_inner_fc = ee_innerJoin.apply(
-        ee_MOD_ic, ee_MYD_ic, ee_filterTimeEq
-    )  # Join Returns feature collection
-
-    ee_MCD_inner_ic = ee.imagecollection.ImageCollection(
-        ee_MCD_inner_fc.map(
-            lambda feature: ee.image.Image.cat(
-                feature.get("primary"), feature.get("secondary")
-            )
+    ee_saveFirstJoin = ee.join.Join.saveFirst(matchKey="aqua_match", outer=True)
+
+    # (2) Add Aqua bands to Terra images, or an empty Aqua band if there's no Aqua image for that date
+    # Result images should have 2 Bands (LandCover_T, LandCover_A)
+    ee_MOD_with_MYD_ic = ee.imagecollection.ImageCollection(
+        ee_saveFirstJoin.apply(ee_MOD_ic, ee_MYD_ic, ee_filterTimeEq)
+    ).map(
+        lambda image: _ee_add_joined_band(
+            image, match_key="aqua_match", band="LandCover_A"
         )
-    )  # Result images should have 2 Bands (LandCover_T, LandCover_A)
+    )
 
-    # (2) Identify images not present in the other collection
-    # (3) Add Aqua bands to the collection in order to duplicate the bands
-    # (4) Rename the duplicate bands to match the collection with the inner join number of Aqua bands (8 bands)
+    # (3) Identify Aqua (MYD) images that are not in Terra (MOD) collection
+    # (4) Add an empty Terra band to match the bands of the joined collection
     invertedJoin = ee.join.Join.inverted()
 
-    # Terra (MOD) images that are not in Aqua (MYD) collection
-    ee_MOD_excluding_MYD_ic = ee.imagecollection.ImageCollection(
-        invertedJoin.apply(ee_MOD_ic, ee_MYD_ic, ee_filterTimeEq)
-    ).map(lambda image: _ee_add_missing_band(image, band="LandCover_A"))
-
-    # Aqua (MYD) images that are not in Terra (MOD) collection
     ee_MYD_excluding_MOD_ic = ee.imagecollection.ImageCollection(
         invertedJoin.apply(ee_MYD_ic, ee_MOD_ic, ee_filterTimeEq)
     ).map(lambda image: _ee_add_missing_band(image, band="LandCover_T"))
 
     # (5) Merge and sort the collections
-    ee_join_all_ic = (
-        ee_MCD_inner_ic.merge(ee_MOD_excluding_MYD_ic)
-        .merge(ee_MYD_excluding_MOD_ic)
-        .sort("system:time_start")
+    ee_join_all_ic = ee_MOD_with_MYD_ic.merge(ee_MYD_excluding_MOD_ic).sort(
+        "system:time_start"
     )
 
     # # -------- ADD TAC & QA BANDS --------#
 
-    ee_TAC_step_01_ic = ee_join_all_ic.map(_ee_calculate_TAC).select(["TAC", "QA_CR"])
+    ee_TAC_step_01_ic = ee_join_all_ic.map(_ee_calculate_TAC)
 
     return ee_TAC_step_01_ic
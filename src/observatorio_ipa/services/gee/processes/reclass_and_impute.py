@@ -20,19 +20,18 @@ def _split_cloud_snow_bands(image: ee.image.Image) -> ee.image.Image:
     args:
         image (ee.image.Image): Image with TAC band
     returns:
-        ee.image.Image: Image with Cloud_TAC and Snow_TAC bands added
+        ee.image.Image: Image with Cloud_TAC, Snow_TAC and QA_CR bands
 
     """
-    # TODO: Check why they are setting system:time_start again if it's already in the original image
-
-    ee_cloud_img = image.select("TAC").eq(0).multiply(100).rename("Cloud_TAC")
-    ee_snow_img = image.select("TAC").eq(100).multiply(100).rename("Snow_TAC")
-
-    return (
-        image.addBands(ee_cloud_img)
-        .addBands(ee_snow_img)
-        .set("system:time_start", image.get("system:time_start"))
-    )  # type: ignore
+    # TAC is selected once and both masks are added in a single addBands.
+    # addBands keeps the image properties, system:time_start doesn't need to be set again
+    ee_tac_img = image.select("TAC")
+    ee_cloud_img = ee_tac_img.eq(0).multiply(100).rename("Cloud_TAC")
+    ee_snow_img = ee_tac_img.eq(100).multiply(100).rename("Snow_TAC")
+
+    return image.addBands(ee.image.Image.cat([ee_cloud_img, ee_snow_img])).select(
+        ["Cloud_TAC", "Snow_TAC", "QA_CR"]
+    )
 
 
 def tac_reclass_and_impute(
@@ -40,6 +39,8 @@ def tac_reclass_and_impute(
     ee_aqua_ic: ee.imagecollection.ImageCollection,
     ee_aoi_fc: ee.featurecollection.FeatureCollection,
     ee_dem_img: ee.image.Image,
+    parallel_scale: int = 4,
+    skip_gap_free: bool = False,
 ) -> ee.imagecollection.ImageCollection:
     """Creates a joint Terra/Aqua ImageCollection to identify pixels covered by Snow
     and imputes missing values from temporal and spatial neighbors.
@@ -61,6 +62,10 @@ def tac_reclass_and_impute(
         ee_aqua_ic (ee.imagecollection.ImageCollection): The Aqua daily image collection.
         ee_aoi_fc (ee.featurecollection.FeatureCollection): The area of interest feature collection.
         ee_dem_img (ee.image.Image): The digital elevation model image.
+        parallel_scale (int): parallelScale for region reductions, higher values help avoid memory limit
+            errors on large areas. Defaults to 4.
+        skip_gap_free (bool): Skip temporal imputation of images without missing values in the area of interest.
+            Adds a region reduction per image. Defaults to False.
 
     Returns:
         ee.imagecollection.ImageCollection: The reclassified and imputed image collection.
@@ -74,17 +79,23 @@ def tac_reclass_and_impute(
     ee_merged_ic = merge.merge(ee_terra_reclass_ic, ee_aqua_reclass_ic)
 
     # step 2: Impute TAC values from temporal time series
-    ee_temporal_ic = temporal.ic_impute_tac_temporal(ee_merged_ic)
+    ee_temporal_ic = temporal.ic_impute_tac_temporal(
+        ee_merged_ic,
+        ee_aoi_fc,
+        parallel_scale=parallel_scale,
+        skip_gap_free=skip_gap_free,
+    )
 
     # # step 3: Impute from spatial neighbors
     ee_spatial4_ic = spatial_4.ic_impute_TAC_spatial4(ee_temporal_ic)
 
     # # step 4: Impute from spatial neighbors and DEM data
-    ee_spatial8_ic = spatial_8.ic_impute_tac_spatial_dem(ee_spatial4_ic, ee_dem_img)
-
     # step 5: Split cloud and snow bands
-    ee_cloud_snow_ic = ee_spatial8_ic.map(_split_cloud_snow_bands).select(
-        "Cloud_TAC", "Snow_TAC", "QA_CR"
+    # Steps 4 and 5 are applied in the same map to traverse the collection only once
+    ee_cloud_snow_ic = ee_spatial4_ic.map(
+        lambda image: _split_cloud_snow_bands(
+            spatial_8._ee_impute_tac_spatial_dem(image, ee_dem_img)
+        )
     )
 
     return ee_cloud_snow_ic
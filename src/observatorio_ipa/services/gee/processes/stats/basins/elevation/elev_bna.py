@@ -15,9 +15,6 @@ Originally based on JS code from users/observatorionieves/modules/Estadistica/Cu
 # ? The original code does not apply "distinct()" to the list of basins but the comment says "valores únicos" (see line 501 of JS code)
 # ? why do SCI and CCI need to be corrected?
 # ? why is it being called slope reclass and not elevation reclass?
-# ? in calculating the area the final features have 'area' and 'Area'properties with m2 and km2 respectively, isn't this dangerous if someone uses the wrong one later on?
-
-# TODO: consider moving DEM elevation segmentation to a separate function, it's not core to this
 
 
 import ee
@@ -27,56 +24,87 @@ from typing import Literal
 from observatorio_ipa.services.gee.processes.stats import common
 
 
-def _ee_calc_elevation_area(
-    elev, ee_elev_vectors_fc: ee.featurecollection.FeatureCollection
+def _ee_bin_key(ee_bin) -> ee.ee_string.String:
+    """Returns the dictionary key for an elevation bin index (e.g. 12 -> "12")."""
+    return ee.ee_number.Number(ee_bin).toInt().format("%d")
+
+
+def _ee_elevation_bin_to_feature(
+    ee_bin, ee_area_by_bin_dict: ee.dictionary.Dictionary
 ) -> ee.feature.Feature:
     """
-    Returns a single feature with the aggregated area for a specified elevation.
+    Returns a single feature with the aggregated area for an elevation bin.
+
+    Rescaling, renaming and formatting are done here so the collection is only mapped once.
 
     Args:
-        elev (int or float): The elevation value to filter features by.
-        ee_elev_vectors_fc (ee.featurecollection.FeatureCollection): The input FeatureCollection containing elevation features.
+        ee_bin (ee.ee_number.Number): Elevation bin index (elevation / 100).
+        ee_area_by_bin_dict (ee.dictionary.Dictionary): Area (m2) per elevation bin, keyed by bin index (see _ee_bin_key).
+            Bins without pixels in the basin are not in the dictionary and get an area of 0.
 
     Returns:
-        ee.feature.Feature: An Earth Engine feature with properties:
-            - "variable": The elevation value.
-            - "group": The string "SCA".
-            - "area": The area of the united geometry.
+        ee.feature.Feature: An Earth Engine feature without geometry and with properties:
+            - "Elevation": The elevation value (bin index * 100).
+            - "Area": The area of the elevation bin in km2, formatted to 2 decimals.
     """
-    ee_filtered_fc: ee.featurecollection.FeatureCollection = ee_elev_vectors_fc.filter(
-        ee.filter.Filter.eq("elevation", elev)
+    ee_area_m2 = ee.ee_number.Number(ee_area_by_bin_dict.get(_ee_bin_key(ee_bin), 0))
+    return ee.feature.Feature(
+        None,
+        {
+            "Elevation": ee.ee_number.Number(ee_bin).multiply(100),
+            "Area": ee_area_m2.divide(1000000).format("%.2f"),
+        },
     )
 
-    # recasting to FeatureCollection only for Python linting purposes.
-    ee_united_fc = ee.featurecollection.FeatureCollection(
-        ee_filtered_fc.union(1).set("elevation", elev)
+
+def _ee_make_elev_bin_area_img(ee_dem_img: ee.image.Image) -> ee.image.Image:
+    """Classify DEM elevation into 100m bins and pair each pixel with its area.
+
+    The result does not depend on the basin, so it can be built once and reused for all basins.
+
+    Args:
+        ee_dem_img (ee.image.Image): Digital Elevation Model image with an 'elevation' band.
+    Returns:
+        ee.image.Image: Image with bands 'bin' (elevation bin index, elevation / 100) and 'area' (pixel area in m2).
+    """
+    # ------------------------------------------------------------------------------------------------------------------------------
+    # ! this DEM split per bins seems redundante since DEM Bins were already created in 'Exportación_Total.js'
+    # ! The code below eliminates the range 0-100 and forces DEM elevation bins to start at 100. Everything <=100 is set to 100
+    # ! The DEM bin calculation is inconsistent between 'Exportación_Total.js' and here, the first rounds elevation downwards (222 -> 200)
+    # ! Here elevation is rounded upwards (150 -> 200). They "work" by chance because elevations rounded downwards are covered by the
+    # ! lte upper bound, however, everything between 0-199 will be forced to 100
+    # ------------------------------------------------------------------------------------------------------------------------------
+
+    # Classify elevation to the nearest upper 100m ceiling, set elev values between ]0, 100] to 100 (e.g., 101 -> 200, 201 -> 300, 300 -> 300)
+    # - Bins are kept as an index (elevation / 100) and scaled back to meters after the reduction. The highest index (69)
+    #   fits in a byte.
+    # - max(1) covers [0, 100[ without a per-pixel conditional (negative elevations are already masked in the DEM)
+    ee_slope_reclass_img: ee.image.Image = (
+        ee_dem_img.select("elevation").divide(100).ceil().max(1).toUint8()
     )
-    ee_area = ee_united_fc.geometry().area()
-
-    # recast element as Feature to avoid linting highlight and set properties
-    # ? if elevation=elev was already set why add variable=elev again?
-    # ? why set group=SCA if this is not a snow cover area?
-    ee_feature = ee.feature.Feature(
-        ee_united_fc.first()
-        .set("variable", elev)
-        .set("group", "SCA")
-        .set("area", ee_area)
+
+    # Set missing pixels to bin 1 (100m) to mimic ee.Image(100) from original code
+    ee_slope_reclass_img = ee_slope_reclass_img.unmask(1)
+
+    return ee_slope_reclass_img.rename("bin").addBands(
+        ee.image.Image.pixelArea().rename("area")
     )
-    return ee_feature
 
 
 def _ee_calc_basin_area_per_elev_bin(
     basin_code: str,
     basins_cd_property: str,
     ee_basins_fc: ee.featurecollection.FeatureCollection,
-    ee_dem_img: ee.image.Image,
+    ee_elev_bin_area_img: ee.image.Image,
+    ee_dem_proj: ee.projection.Projection,
 ):
     """Calculate the area per elevation bin for a given basin.
     Args:
         basin_code (str): Basin code to filter the feature collection.
         basins_cd_property (str): Property name to filter basins.
         ee_basins_fc (ee.featurecollection.FeatureCollection): FeatureCollection with basin polygons.
-        ee_dem_img (ee.image.Image): Digital Elevation Model image.
+        ee_elev_bin_area_img (ee.image.Image): Image with elevation bin and pixel area bands (see _ee_make_elev_bin_area_img).
+        ee_dem_proj (ee.projection.Projection): Projection of the DEM image, used for the reduction.
     Returns:
         ee.featurecollection.FeatureCollection: FeatureCollection with elevation bins and their respective areas.
     """
@@ -89,80 +117,50 @@ def _ee_calc_basin_area_per_elev_bin(
     )
 
     # ------------------------------------------------------------------------------------------------------------------------------
-    # 3. Identify Geometry Vectors per elevation
-    # ! this DEM split per bins seems redundante since DEM Bins were already created in 'Exportación_Total.js'
-    # ! The code below eliminates the range 0-100 and forces DEM elevation bins to start at 100. Everything <=100 is set to 100
-    # ! The DEM bin calculation is inconsistent between 'Exportación_Total.js' and here, the first rounds elevation downwards (222 -> 200)
-    # ! Here elevation is rounded upwards (150 -> 200). They "work" by chance because elevations rounded downwards are covered by the
-    # ! lte upper bound, however, everything between 0-199 will be forced to 100
+    # 2. Calculate Area per elevation (Create FeatureCollection)
+    # Pixel areas are summed per elevation bin in a single grouped reduction instead of vectorizing the bins and
+    # running a union per bin. The reduction geometry limits the sum to the basin, no clip is needed.
     # ------------------------------------------------------------------------------------------------------------------------------
-    ee_clip_elev_img: ee.image.Image = ee_dem_img.select("elevation").clip(ee_basin_fc)
-
-    # Classify elevation to the nearest upper 100m ceiling, set elev values between ]0, 100] to 100 (e.g., 101 -> 200, 201 -> 300, 300 -> 300)
-    ee_slope_reclass_img: ee.image.Image = ee_clip_elev_img.expression(
-        "elev >= 0 && elev < 100 ? 100 : ceil(elev / 100) * 100",
-        {"elev": ee_clip_elev_img.select("elevation")},
-    ).toInt()
-
-    # Set missing pixels to 100 to mimic ee.Image(100) from original code
-    ee_slope_reclass_img = ee_slope_reclass_img.unmask(100)
-
-    # Convert classified elevation zones to vectors
-    # - adjacent pixels with the same elevation bin are grouped under the same vector/feature
-    # - separate (non continuous) pixels with the same elevation bin are grouped as separate vectors/features
-    #! There's no advantage in getting the mean of ee_dem_img since it has also already been classified to 100m bins
-    ee_vectors_fc: (
-        ee.featurecollection.FeatureCollection
-    ) = ee_slope_reclass_img.addBands(ee_dem_img).reduceToVectors(
-        geometry=ee_basin_fc,
-        crs=ee_dem_img.projection(),
-        scale=DEFAULT_SCALE,
-        geometryType="polygon",
-        eightConnected=False,
-        labelProperty="elevation",
-        reducer=ee.reducer.Reducer.mean(),
+    ee_groups_list = ee.ee_list.List(
+        ee_elev_bin_area_img.reduceRegion(
+            reducer=ee.reducer.Reducer.sum().group(groupField=0, groupName="bin"),
+            geometry=ee_basin_fc.geometry(),
+            crs=ee_dem_proj,
+            scale=DEFAULT_SCALE,
+            maxPixels=1e13,
+        ).get("groups")
     )
 
-    # Generate max and min elevation values by area of interest
-    ee_max_elevation = ee_vectors_fc.aggregate_max("elevation")
-    ee_min_elevation = ee_vectors_fc.aggregate_min("elevation")
-
-    # ------------------------------------------------------------------------------------------------------------------------------
-    # 4. Calculate Area per elevation (Create FeatureCollection)
-    # ! Below code starts at elevation 0 but this would be ignored since Bin range above forces first bin to be 100
-    # ------------------------------------------------------------------------------------------------------------------------------
-    # Efficiently generate elevation features using a loop and ee.List
-
-    ee_elevations_list = ee.ee_list.List.sequence(0, 6900, 100)
-
-    ee_elevation_vectors_fc = ee.featurecollection.FeatureCollection(
-        ee_elevations_list.map(
-            lambda elev: _ee_calc_elevation_area(elev, ee_vectors_fc)
-        )
-    )
-
-    # ee_elevation_vectors_fc = ee_elevation_vectors_fc.map(_ee_rescale_and_rename)
-
-    # Rescale area from m2 to km2 and rename property
-    ee_elevation_vectors_fc = common._ee_rescale_m_to_km_fc(
-        ee_elevation_vectors_fc, "area", "Area"
+    ee_bins_list = ee_groups_list.map(
+        lambda ee_group: ee.dictionary.Dictionary(ee_group).get("bin")
     )
-    # Rename elevation property to "Elevation"
-    ee_elevation_vectors_fc = common._ee_copy_feature_property_across_fc(
-        ee_elevation_vectors_fc, "variable", "Elevation"
+    ee_area_by_bin_dict = ee.dictionary.Dictionary.fromLists(
+        ee_bins_list.map(_ee_bin_key),
+        ee_groups_list.map(
+            lambda ee_group: ee.dictionary.Dictionary(ee_group).get("sum")
+        ),
     )
 
-    # Format to 2 decimals
-    ee_elevation_vectors_fc = common._ee_format_properties_2decimals(
-        ee_elevation_vectors_fc, ["Area"]
+    # Grouping only returns bins with pixels. As in the original code, every bin between the basin's min and max
+    # elevation is kept, bins without pixels (gaps) are reported with area 0.
+    ee_basin_bins_list = ee.ee_list.List(
+        ee.Algorithms.If(
+            ee_bins_list.size().gt(0),
+            ee.ee_list.List.sequence(
+                ee_bins_list.reduce(ee.reducer.Reducer.min()),
+                ee_bins_list.reduce(ee.reducer.Reducer.max()),
+            ),
+            ee.ee_list.List([]),
+        )
     )
 
-    # Filter FeatureCollection to min-max elevation in the basin to reduce size
-    ee_trimmed_elevation_vectors_fc = ee_elevation_vectors_fc.filter(
-        ee.filter.Filter.lte("Elevation", ee_max_elevation)
-    ).filter(ee.filter.Filter.gte("Elevation", ee_min_elevation))
+    ee_elevation_vectors_fc = ee.featurecollection.FeatureCollection(
+        ee_basin_bins_list.map(
+            lambda ee_bin: _ee_elevation_bin_to_feature(ee_bin, ee_area_by_bin_dict)
+        )
+    )
 
-    return ee_trimmed_elevation_vectors_fc
+    return ee_elevation_vectors_fc
 
 
 class Elev_BNA(common.BaseBasinStats):
@@ -195,22 +193,36 @@ class Elev_BNA(common.BaseBasinStats):
         max_exports: int | None = None,
         **kwargs,
     ):
-        # lazy argument passing. Consider moving to explicit arguments
-        kwargs = {k: v for k, v in locals().items() if k != "self"}
+        # Extra kwargs (e.g. ee_icollection from shared workflow args) are not used by this class
         # Dummy image collection to avoid error in parent init
         ee_icollection = ee.imagecollection.ImageCollection([])
         self.ee_dem_img = ee_dem_img
+        # Elevation bins don't depend on the basin, build them once for all basins
+        self.ee_elev_bin_area_img = _ee_make_elev_bin_area_img(ee_dem_img)
+        self.ee_dem_proj = ee_dem_img.projection()
         bands_of_interest = ["Elevation", "Area"]
         super().__init__(
             ee_icollection=ee_icollection,
+            ee_basins_fc=ee_basins_fc,
+            basins_cd_property=basins_cd_property,
+            export_target=export_target,
+            export_path=export_path,
+            table_prefix=table_prefix,
             bands_of_interest=bands_of_interest,
-            **kwargs,
+            storage_bucket=storage_bucket,
+            basin_codes=basin_codes,
+            exclude_basin_codes=exclude_basin_codes,
+            max_exports=max_exports,
         )
 
     def stats_proc(self, basin_code) -> ee.featurecollection.FeatureCollection:
         # Implement snowline calculation logic here
         ee_stats_fc = _ee_calc_basin_area_per_elev_bin(
-            basin_code, self.basins_cd_property, self.ee_basins_fc, self.ee_dem_img
+            basin_code,
+            self.basins_cd_property,
+            self.ee_basins_fc,
+            self.ee_elev_bin_area_img,
+            self.ee_dem_proj,
         )
 
         return ee_stats_fc
@@ -12,50 +12,35 @@ from observatorio_ipa.services.gee.processes.stats import common
 # from observatorio_ipa.core.defaults import DEFAULT_CHI_PROJECTION, DEFAULT_SCALE
 
 
-def _ee_calc_stats_per_elev_bin(
-    basin_code: str,
-    basins_cd_property: str,
-    ee_basins_fc: ee.featurecollection.FeatureCollection,
+def _ee_make_sca_cca_dem_img(
     ee_icollection: ee.imagecollection.ImageCollection,
     ee_dem_img: ee.image.Image,
-) -> ee.featurecollection.FeatureCollection:
-    """Class to calculate SCA (Snow Cover Area) and CCA (Cloud Cover Area) means per elevation bin for a Time Series
-    ImageCollection and an Area of Interest (basin)
-
-    Result SCA and CCA values are between [0, 100]
+) -> ee.image.Image:
+    """Calculate the temporal mean of corrected SCA and CCA and stack it with DEM elevation bins.
 
+    The result does not depend on the basin, so it can be built once and reused for all basins.
 
     Args:
-        basin_code (str): Basin code to filter the FeatureCollection.
-        basins_cd_property (str): Name of the property that has basin codes in the FeatureCollection.
-        ee_basins_fc (ee.featurecollection.FeatureCollection): FeatureCollection with basin polygons.
         ee_icollection (ee.imagecollection.ImageCollection): ImageCollection with monthly images.
         ee_dem_img (ee.image.Image): DEM image to use for elevation bins (assumes elevation has been segmented to bins).
     Returns:
-        ee.featurecollection.FeatureCollection: FeatureCollection with mean SCA and CCA per elevation bin.
+        ee.image.Image: Image with bands SCA, CCA and elevation.
     """
 
-    ee_basin_fc = ee_basins_fc.filter(
-        ee.filter.Filter.eq(basins_cd_property, basin_code)
-    )
-
     # ------------------------------------------------------------------------------------------------------------------------------
     # Correct SCI and CCI
     # ------------------------------------------------------------------------------------------------------------------------------
 
     # Apply correction functions to original collection. Corrects the whole Image, not just the basin
-    ee_TACbyYear_ic: ee.imagecollection.ImageCollection = (
-        ee_icollection.map(
-            lambda ee_img: common._ee_correct_CCI_band(ee_img, "Cloud_TAC", "CP")
-        )
-        .map(
-            lambda ee_img: common._ee_correct_SCI_band(
-                ee_img, "Snow_TAC", "Cloud_TAC", "SP"
-            )
-        )
-        .select(
-            ["SP", "CP"], ["SCA", "CCA"]
-        )  # rename bands back to original names to keep below code as-is
+    # Both corrections and the band selection run in a single map over the collection
+    def _ee_correct_sca_cca(ee_img: ee.image.Image) -> ee.image.Image:
+        ee_img = common._ee_correct_CCI_band(ee_img, "Cloud_TAC", "CP")
+        ee_img = common._ee_correct_SCI_band(ee_img, "Snow_TAC", "Cloud_TAC", "SP")
+        # rename bands back to original names to keep below code as-is
+        return ee_img.select(["SP", "CP"], ["SCA", "CCA"])
+
+    ee_TACbyYear_ic: ee.imagecollection.ImageCollection = ee_icollection.map(
+        _ee_correct_sca_cca
     )
 
     # ------------------------------------------------------------------------------------------------------------------------------
@@ -64,36 +49,71 @@ def _ee_calc_stats_per_elev_bin(
     # ------------------------------------------------------------------------------------------------------------------------------
     ee_TACbyYear_img = ee_TACbyYear_ic.mean()
 
-    # ------------------------------------------------------------------------------------------------------------------------------
-    # Calculate SCA by elevation (SCA pixel values are between [0-100])
-    # - This is the mean of a mean of a mean. Mean of the pixels in the Area, from the mean of the months in the collection,
-    # - from the mean of the days in the month.
-    # ------------------------------------------------------------------------------------------------------------------------------
-
-    ee_sca_fc = common._ee_calc_spatial_mean_per_elev(
-        ee_TACbyYear_img, ee_dem_img, ee_basin_fc, "SCA", "SCA"
+    return ee_TACbyYear_img.select(["SCA", "CCA"]).addBands(
+        ee_dem_img.select("elevation")
     )
 
-    # ------------------------------------------------------------------------------------------------------------------------------
-    # Calculate CCA by elevation (CCA pixel values are between [0-100])
-    # - This is the mean of a mean of a mean. Mean of the pixels in the Area, from the mean of the months in the collection,
-    # - from the mean of the days in the month.
-    # ------------------------------------------------------------------------------------------------------------------------------
 
-    ee_cca_fc = common._ee_calc_spatial_mean_per_elev(
-        ee_TACbyYear_img, ee_dem_img, ee_basin_fc, "CCA", "CCA"
+def _ee_calc_stats_per_elev_bin(
+    basin_code: str,
+    basins_cd_property: str,
+    ee_basins_fc: ee.featurecollection.FeatureCollection,
+    ee_sca_cca_dem_img: ee.image.Image,
+) -> ee.featurecollection.FeatureCollection:
+    """Class to calculate SCA (Snow Cover Area) and CCA (Cloud Cover Area) means per elevation bin for a Time Series
+    ImageCollection and an Area of Interest (basin)
+
+    Result SCA and CCA values are between [0, 100]
+
+
+    Args:
+        basin_code (str): Basin code to filter the FeatureCollection.
+        basins_cd_property (str): Name of the property that has basin codes in the FeatureCollection.
+        ee_basins_fc (ee.featurecollection.FeatureCollection): FeatureCollection with basin polygons.
+        ee_sca_cca_dem_img (ee.image.Image): Image with temporal mean SCA and CCA and elevation bands (see _ee_make_sca_cca_dem_img).
+    Returns:
+        ee.featurecollection.FeatureCollection: FeatureCollection with mean SCA and CCA per elevation bin.
+    """
+
+    ee_basin_fc = ee_basins_fc.filter(
+        ee.filter.Filter.eq(basins_cd_property, basin_code)
     )
 
     # ------------------------------------------------------------------------------------------------------------------------------
-    # Merge SCA and CCA collections
+    # Calculate SCA and CCA by elevation (SCA and CCA pixel values are between [0-100])
+    # - This is the mean of a mean of a mean. Mean of the pixels in the Area, from the mean of the months in the collection,
+    # - from the mean of the days in the month.
+    # - Both bands are reduced in a single grouped pass, returning the means as a list in band order [SCA, CCA]
+    # - repeat() only counts pixels where both bands are valid. SCA is computed from the Snow_TAC and Cloud_TAC bands
+    #   of the same images and Image.divide() returns 0 instead of masking where 100 - CCA is 0, so SCA and CCA share
+    #   one mask and the grouped mean uses the same pixels as a separate reduction per band.
     # ------------------------------------------------------------------------------------------------------------------------------
-
-    ee_merged_sca_cca_fc = common._ee_merge_feature_collections(
-        ee_sca_fc, ee_cca_fc, primary_key="Elevation"
+    ee_stats_by_elev_dict = ee_sca_cca_dem_img.reduceRegion(
+        reducer=ee.reducer.Reducer.mean()
+        .repeat(2)
+        .group(groupField=2, groupName="elevation"),
+        geometry=ee_basin_fc,
+        scale=100,
+        maxPixels=ee.ee_number.Number(1e10),
     )
+    ee_stats_by_elev_list = ee.ee_list.List(ee_stats_by_elev_dict.get("groups"))
+
+    # Means are formatted to 2 decimals while building the features to avoid another pass over the collection.
+    # Groups only include pixels where both bands are valid, so the means are never null.
+    def _ee_make_feature(ee_item_dict) -> ee.feature.Feature:
+        ee_item_dict = ee.dictionary.Dictionary(ee_item_dict)
+        ee_means_list = ee.ee_list.List(ee_item_dict.get("mean"))
+        return ee.feature.Feature(
+            None,
+            {
+                "Elevation": ee_item_dict.get("elevation"),
+                "SCA": ee.ee_number.Number(ee_means_list.get(0)).format("%.2f"),
+                "CCA": ee.ee_number.Number(ee_means_list.get(1)).format("%.2f"),
+            },
+        )
 
-    ee_merged_sca_cca_fc = common._ee_format_properties_2decimals(
-        ee_merged_sca_cca_fc, properties=["SCA", "CCA"]
+    ee_merged_sca_cca_fc = ee.featurecollection.FeatureCollection(
+        ee_stats_by_elev_list.map(_ee_make_feature)
     )
 
     return ee_merged_sca_cca_fc
@@ -132,11 +152,23 @@ class SCA_Elev_BNA(common.BaseBasinStats):
         max_exports: int | None = None,
         **kwargs,
     ):
-        # lazy argument passing. Consider moving to explicit arguments
-        args = {k: v for k, v in locals().items() if k != "self"}
         bands_of_interest = ["Elevation", "SCA", "CCA"]
         self.ee_dem_img = ee_dem_img
-        super().__init__(bands_of_interest=bands_of_interest, **args)
+        # Corrected SCA/CCA means don't depend on the basin, build them once for all basins
+        self.ee_sca_cca_dem_img = _ee_make_sca_cca_dem_img(ee_icollection, ee_dem_img)
+        super().__init__(
+            ee_icollection=ee_icollection,
+            ee_basins_fc=ee_basins_fc,
+            basins_cd_property=basins_cd_property,
+            export_target=export_target,
+            export_path=export_path,
+            table_prefix=table_prefix,
+            bands_of_interest=bands_of_interest,
+            storage_bucket=storage_bucket,
+            basin_codes=basin_codes,
+            exclude_basin_codes=exclude_basin_codes,
+            max_exports=max_exports,
+        )
 
     def stats_proc(self, basin_code) -> ee.featurecollection.FeatureCollection:
         # Implement snowline calculation logic here
@@ -144,8 +176,7 @@ class SCA_Elev_BNA(common.BaseBasinStats):
             basin_code,
             self.basins_cd_property,
             self.ee_basins_fc,
-            self.ee_icollection,
-            self.ee_dem_img,
+            self.ee_sca_cca_dem_img,
         )
 
         return ee_stats_fc
@@ -17,24 +17,28 @@ from observatorio_ipa.services.gee.processes.stats import common
 def _ee_calc_month_xci_temporal_stats(
     m: int,
     ee_icollection: ee.imagecollection.ImageCollection,
-    ee_basin_fc: ee.featurecollection.FeatureCollection,
+    bands: list[str] | None = None,
+    include_std_dev: bool = True,
+    include_percentiles: bool = True,
 ) -> ee.image.Image:
     """Calculates pixel level statistics for Snow and Cloud for a given month of the year across all years in a
     Time Series ImageCollection.
 
     This is a wrapper of common._ee_calc_cci_sci_temporal_stats that calculates statistics for a specific month.
 
-    Calculates pixel level mean and percentiles (p0, p25, p50, p75, p100) for Snow and Cloud and clips image to
-    an area of interest. Requires 'Snow_TAC' and 'Cloud_TAC' bands.
+    Calculates pixel level mean, stdDev and percentiles (p0, p5, p25, p50, p75, p90, p100) for Snow and Cloud.
+    Requires 'Snow_TAC' and 'Cloud_TAC' bands. The image is not clipped, spatial reductions are limited by the area
+    of interest instead.
 
-    Resulting image has the following bands Snow_mean, Cloud_mean, Snow_TAC_p0, Snow_TAC_p25, Snow_TAC_p50,
-    Snow_TAC_p75, Snow_TAC_p100, Cloud_TAC_p0, Cloud_TAC_p25, Cloud_TAC_p50, Cloud_TAC_p75, Cloud_TAC_p100,
-    and a property 'month' with the month number.
+    Resulting image has the statistics bands from common._ee_calc_cci_sci_temporal_stats (e.g. Snow_TAC_mean,
+    Snow_TAC_p50, Cloud_TAC_mean) and a property 'month' with the month number.
 
     Args:
         m: Month to filter the collection
         ee_icollection: Time series ImageCollection with Snow_TAC and Cloud_TAC bands.
-        ee_basin_fc: FeatureCollection with basin polygons. (Area of Interest)
+        bands: Bands to calculate statistics for. Defaults to ["Snow_TAC", "Cloud_TAC"].
+        include_std_dev: Whether to calculate stdDev.
+        include_percentiles: Whether to calculate percentiles.
     Returns:
         ee.image.Image: Image with pixel level statistics for Snow and Cloud for the given month.
 
@@ -45,19 +49,77 @@ def _ee_calc_month_xci_temporal_stats(
         ee.filter.Filter.calendarRange(m, m, "month")
     )
 
-    ee_temporal_stats_img = common._ee_calc_cci_sci_temporal_stats(ee_month_ic)
+    ee_temporal_stats_img = common._ee_calc_cci_sci_temporal_stats(
+        ee_month_ic, bands, include_std_dev, include_percentiles
+    )
 
     ee_temporal_stats_img = ee_temporal_stats_img.set("month", m)
-
-    # Clip to basin
-    ee_temporal_stats_img = ee_temporal_stats_img.clip(ee_basin_fc)  # type: ignore
     return ee_temporal_stats_img
 
 
+def _ee_calc_month_temporal_stats_ic(
+    ee_icollection: ee.imagecollection.ImageCollection,
+    bands: list[str] | None = None,
+    include_std_dev: bool = True,
+    include_percentiles: bool = True,
+) -> ee.imagecollection.ImageCollection:
+    """Calculates pixel level statistics for Snow and Cloud for each month of the year (1-12) across all years in a
+    Time Series ImageCollection.
+
+    Applies SCI and CCI corrections before calculating the statistics. The result does not depend on the area of
+    interest, so it can be calculated once and reused for all basins.
+
+    Args:
+        ee_icollection: Time series ImageCollection with Snow_TAC and Cloud_TAC bands.
+        bands: Bands to calculate statistics for. Defaults to ["Snow_TAC", "Cloud_TAC"].
+        include_std_dev: Whether to calculate stdDev.
+        include_percentiles: Whether to calculate percentiles.
+    Returns:
+        ee.imagecollection.ImageCollection: Collection with one image per month (see _ee_calc_month_xci_temporal_stats)
+    """
+
+    # ---------------------------------------------------------------------------------------------------------------------
+    # SCI and CCI correction
+    # ---------------------------------------------------------------------------------------------------------------------
+
+    # Both corrections are applied in a single map to avoid an intermediate collection
+    ee_TACbyMonth_ic = ee_icollection.map(
+        lambda ee_img: common._ee_correct_SCI_band(
+            common._ee_correct_CCI_band(ee_img, "Cloud_TAC", "CP"),
+            "Snow_TAC",
+            "Cloud_TAC",
+            "SP",
+        )
+    ).select(
+        ["SP", "CP"], ["Snow_TAC", "Cloud_TAC"]
+    )  # rename bands back to original names to keep below code as-is
+
+    # ------------------------------------------------------------------------------------------------------------------------------
+    # Month Reduction - Calculate Statistics for each month across years
+    # - These are stats (mean and percentiles) of the pixels of the same month across the years, from the mean values of the days
+    # - in the month.
+    # ------------------------------------------------------------------------------------------------------------------------------
+
+    ee_months_list = ee.ee_list.List.sequence(1, 12)
+
+    return ee.imagecollection.ImageCollection.fromImages(
+        ee_months_list.map(
+            lambda ee_month: _ee_calc_month_xci_temporal_stats(
+                ee_month,
+                ee_TACbyMonth_ic,
+                bands,
+                include_std_dev,
+                include_percentiles,
+            )
+        )  # Each month returns a single Image, no need to flatten
+    )
+
+
 def _ee_calc_month_spatial_mean(
     ee_image: ee.image.Image,
     ee_basin_fc: ee.featurecollection.FeatureCollection,
     region_property: str,
+    tile_scale: int | ee.ee_number.Number = 1,
 ) -> ee.featurecollection.FeatureCollection:
     """Calculates the spatial mean(s) for a given month of the year (January, February, ...).
 
@@ -70,11 +132,14 @@ def _ee_calc_month_spatial_mean(
         ee_image: Image with one or more band and a 'month' property
         ee_basin_fc: FeatureCollection with area of interest polygons
         region_property: Property from Area of Interest to keep in results
+        tile_scale: tileScale for the reduction (see common._ee_get_tile_scale). Default is 1.
     Returns:
         ee.featurecollection.FeatureCollection: FeatureCollection with mean values.
     """
 
-    ee_regions_fc = common._ee_calc_spatial_mean(ee_image, ee_basin_fc, region_property)
+    ee_regions_fc = common._ee_calc_spatial_mean(
+        ee_image, ee_basin_fc, region_property, tile_scale
+    )
 
     def _ee_set_props(ee_feature: ee.feature.Feature, ee_image: ee.image.Image):
         return ee_feature.set("Month", ee_image.get("month"))
@@ -86,18 +151,18 @@ def _ee_calc_month_basin_stats(
     basin_code: str,
     basins_cd_property: str,
     ee_basins_fc: ee.featurecollection.FeatureCollection,
-    ee_icollection: ee.imagecollection.ImageCollection,
+    ee_StatsByMonth_ic: ee.imagecollection.ImageCollection,
 ) -> ee.featurecollection.FeatureCollection:
     """Calculates statistics for a Month of the Year across a multi year Time Series ImageCollection and an Area of Interest (basin).
 
     Calculates Mean (P50 really), P25, P75 for each month across years within a given area of interest (basin).
-    Requires bands Snow_TAC and Cloud_TAC to calculate statistics.
+    Requires the Snow_TAC statistics bands from _ee_calc_month_temporal_stats_ic.
 
     Args:
         basin_code: Basin code to filter the feature collection
         basins_cd_property: Name of the property that has basin codes (default is "BNA")
         ee_basins_fc: FeatureCollection with basin polygons
-        ee_icollection: Time Series ImageCollection with monthly images.
+        ee_StatsByMonth_ic: Collection with temporal statistics per month (see _ee_calc_month_temporal_stats_ic).
 
     Returns:
         ee.featurecollection.FeatureCollection: FeatureCollection with month statistics for the area of interest.
@@ -107,41 +172,7 @@ def _ee_calc_month_basin_stats(
     ee_basin_fc = ee_basins_fc.filter(
         ee.filter.Filter.eq(basins_cd_property, basin_code)
     )
-
-    # ---------------------------------------------------------------------------------------------------------------------
-    # SCI and CCI correction
-    # ---------------------------------------------------------------------------------------------------------------------
-
-    ee_TACbyMonth_ic = (
-        ee_icollection.map(
-            lambda ee_img: common._ee_correct_CCI_band(ee_img, "Cloud_TAC", "CP")
-        )
-        .map(
-            lambda ee_img: common._ee_correct_SCI_band(
-                ee_img, "Snow_TAC", "Cloud_TAC", "SP"
-            )
-        )
-        .select(
-            ["SP", "CP"], ["Snow_TAC", "Cloud_TAC"]
-        )  # rename bands back to original names to keep below code as-is
-    )
-
-    # ------------------------------------------------------------------------------------------------------------------------------
-    # Month Reduction - Calculate Statistics for each month across years for the basin
-    # - These are stats (mean and percentiles) of the pixels of the same month across the years, from the mean values of the days
-    # - in the month.
-    # ------------------------------------------------------------------------------------------------------------------------------
-
-    ee_months_list = ee.ee_list.List.sequence(1, 12)
-
-    # Calculate monthly NDSI (Normalized Difference Snow Index) for the basin
-    ee_StatsByMonth_ic = ee.imagecollection.ImageCollection.fromImages(
-        ee_months_list.map(
-            lambda ee_month: _ee_calc_month_xci_temporal_stats(
-                ee_month, ee_TACbyMonth_ic, ee_basin_fc
-            )
-        ).flatten()  # Flatten is added but might not be necessary
-    )
+    ee_tile_scale = common._ee_get_tile_scale(ee_basin_fc)
 
     # select and rename bands
     ee_StatsByMonth_ic = ee_StatsByMonth_ic.select(
@@ -167,7 +198,7 @@ def _ee_calc_month_basin_stats(
 
     ee_month_basin_stats_fc = ee_StatsByMonth_ic.map(
         lambda ee_img: _ee_calc_month_spatial_mean(
-            ee_img, ee_basin_fc, basins_cd_property
+            ee_img, ee_basin_fc, basins_cd_property, ee_tile_scale
         )
     ).flatten()
 
@@ -213,6 +244,11 @@ class SCA_M_BNA(common.BaseBasinStats):
     ):
         # lazy argument passing. Consider moving to explicit arguments
         args = {k: v for k, v in locals().items() if k != "self"}
+        # Monthly temporal stats don't depend on the basin, calculate them once for all basins
+        # Only Snow statistics are exported, Cloud statistics are skipped
+        self.ee_month_stats_ic = _ee_calc_month_temporal_stats_ic(
+            ee_icollection, bands=["Snow_TAC"]
+        )
         bands_of_interest = [
             "Month",
             "Mean",
@@ -233,7 +269,7 @@ class SCA_M_BNA(common.BaseBasinStats):
             basin_code,
             self.basins_cd_property,
             self.ee_basins_fc,
-            self.ee_icollection,
+            self.ee_month_stats_ic,
         )
 
         return ee_stats_fc
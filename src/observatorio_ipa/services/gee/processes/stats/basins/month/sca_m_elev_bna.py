@@ -19,60 +19,78 @@ def _ee_calc_month_spatial_mean_per_elev(
     ee_image: ee.image.Image,
     ee_dem_img: ee.image.Image,
     ee_basin_fc: ee.featurecollection.FeatureCollection,
-    input_band_name: str = "SCA",
-    output_band_name: str = "SCA",
+    input_band_names: list[str],
+    output_band_names: list[str],
+    tile_scale: int | ee.ee_number.Number = 1,
 ) -> ee.featurecollection.FeatureCollection:
-    """Calculate spatial mean value of a given band per elevation bin for a given month of the year (January, February, ...)
+    """Calculate spatial mean values of the given bands per elevation bin for a given month of the year (January, February, ...)
     in an area of interest (basin).
 
-    This is a wrapper of common._ee_calc_spatial_mean_per_elev that calculates the mean per elevation for a specific image.
+    All bands are reduced in a single grouped pass over the area of interest.
 
     Requires a DEM image with a band named 'elevation' that has been segmented into elevation bins.
 
     The resulting FeatureCollection will have features with properties:
         - Elevation: elevation bin
-        - output_band_name: mean value of the specified band in the elevation bin
+        - output_band_names: mean value of each of the specified bands in the elevation bin
         - imageId: ID of the original image
         - Month: month number
-        - MonthElev: concatenation of Month and Elevation (e.g. "1_1500")
 
 
     Args:
-        ee_image (ee.image.Image): Image with the band to calculate mean for
+        ee_image (ee.image.Image): Image with the bands to calculate mean for
         ee_dem_img (ee.image.Image): DEM image to use for elevation bins (assumes elevation has been segmented to bins)
         ee_basin_fc (ee.featurecollection.FeatureCollection): FeatureCollection with region (basin) geometry
-        input_band_name (str): Name of the band in the image to calculate mean for
-        output_band_name (str): Name of the output band with mean values
+        input_band_names (list[str]): Names of the bands in the image to calculate mean for
+        output_band_names (list[str]): Names of the output properties with mean values, in the same order as input_band_names
+        tile_scale (int | ee.ee_number.Number): tileScale for the reduction (see common._ee_get_tile_scale). Default is 1.
     Returns:
         ee.featurecollection.FeatureCollection: FeatureCollection with mean values per elevation bin
     """
+    n_bands = len(input_band_names)
+
+    # Elevation is the last band, it's used to group the means of all other bands.
+    # repeat() only counts pixels where every band is valid. Snow_TAC_mean and Cloud_TAC_mean are means of the
+    # same monthly collection, and Snow_TAC and Cloud_TAC are split from the same TAC band, so both bands share
+    # one mask and the grouped mean uses the same pixels as a separate reduction per band.
+    ee_metric_dem_img: ee.image.Image = ee_image.select(input_band_names).addBands(
+        ee_dem_img.select("elevation")
+    )
 
-    ee_mean_by_elev_fc = common._ee_calc_spatial_mean_per_elev(
-        ee_image=ee_image,
-        ee_dem_img=ee_dem_img,
-        ee_basin_fc=ee_basin_fc,
-        input_band_name=input_band_name,
-        output_band_name=output_band_name,
+    ee_stats_by_elev_dict = ee_metric_dem_img.reduceRegion(
+        reducer=ee.reducer.Reducer.mean()
+        .repeat(n_bands)
+        .group(groupField=n_bands, groupName="elevation"),
+        geometry=ee_basin_fc,
+        scale=100,
+        maxPixels=ee.ee_number.Number(1e10),
+        tileScale=tile_scale,
     )
+    ee_stat_by_elevation_list = ee.ee_list.List(ee_stats_by_elev_dict.get("groups"))
 
     ee_month = ee.ee_number.Number(ee_image.get("month"))
-
-    def _ee_set_props(
-        ee_feature: ee.feature.Feature, ee_month: ee.ee_number.Number
-    ) -> ee.feature.Feature:
-        ee_elev = ee_feature.get("Elevation")
-        ee_month_elev = (
-            ee.ee_number.Number(ee_month)
-            .format("%.0f")
-            .cat("_")
-            .cat(ee.ee_string.String(ee_elev))
+    ee_image_id = ee_image.id()
+    ee_output_band_names = ee.ee_list.List(output_band_names)
+
+    def _ee_make_feature(ee_item_dict) -> ee.feature.Feature:
+        ee_item_dict = ee.dictionary.Dictionary(ee_item_dict)
+        # with repeat(), means are returned as a list in band order
+        ee_means_dict = ee.dictionary.Dictionary.fromLists(
+            ee_output_band_names, ee.ee_list.List(ee_item_dict.get("mean"))
         )
         return ee.feature.Feature(
-            ee_feature.set("Month", ee_month).set("MonthElev", ee_month_elev)
+            None,
+            ee_means_dict.combine(
+                {
+                    "Elevation": ee_item_dict.get("elevation"),
+                    "imageId": ee_image_id,
+                    "Month": ee_month,
+                }
+            ),
         )
 
-    return ee_mean_by_elev_fc.map(
-        lambda ee_feature: _ee_set_props(ee_feature, ee_month)
+    return ee.featurecollection.FeatureCollection(
+        ee_stat_by_elevation_list.map(_ee_make_feature)
     )
 
 
@@ -80,7 +98,7 @@ def _ee_calc_month_stats_per_elev_bin(
     basin_code: str,
     basins_cd_property: str,
     ee_basins_fc: ee.featurecollection.FeatureCollection,
-    ee_icollection: ee.imagecollection.ImageCollection,
+    ee_StatsByMonth_ic: ee.imagecollection.ImageCollection,
     ee_dem_img: ee.image.Image,
 ) -> ee.featurecollection.FeatureCollection:
     """Calculate SCA (Snow Cover Area) and CCA (Cloud Cover Area) means per elevation bin for the months
@@ -90,7 +108,8 @@ def _ee_calc_month_stats_per_elev_bin(
         basin_code (str): Basin code to filter the FeatureCollection.
         basins_cd_property (str): Name of the property that has basin codes in the FeatureCollection.
         ee_basins_fc (ee.featurecollection.FeatureCollection): FeatureCollection with basin polygons.
-        ee_icollection (ee.imagecollection.ImageCollection): ImageCollection with monthly images.
+        ee_StatsByMonth_ic (ee.imagecollection.ImageCollection): Collection with temporal statistics per month
+            (see sca_m_bna._ee_calc_month_temporal_stats_ic).
         ee_dem_img (ee.image.Image): Digital Elevation Model (DEM)
 
     Returns:
@@ -102,75 +121,23 @@ def _ee_calc_month_stats_per_elev_bin(
     ee_basin_fc = ee_basins_fc.filter(
         ee.filter.Filter.eq(basins_cd_property, basin_code)
     )
+    ee_tile_scale = common._ee_get_tile_scale(ee_basin_fc)
 
     # ---------------------------------------------------------------------------------------------------------------------
-    # SCI and CCI correction
+    # 5. Calculate SCA and CCA by elevation
     # ---------------------------------------------------------------------------------------------------------------------
 
-    ee_TACbyMonth_ic = (
-        ee_icollection.map(
-            lambda ee_img: common._ee_correct_CCI_band(ee_img, "Cloud_TAC", "CP")
-        )
-        .map(
-            lambda ee_img: common._ee_correct_SCI_band(
-                ee_img, "Snow_TAC", "Cloud_TAC", "SP"
-            )
-        )
-        .select(
-            ["SP", "CP"], ["Snow_TAC", "Cloud_TAC"]
-        )  # rename bands back to original names to keep below code as-is
-    )
-
-    # ---------------------------------------------------------------------------------------------------------------------
-    # Month Reduction - Calculate Statistics for each month across years for the basin
-    # ---------------------------------------------------------------------------------------------------------------------
-    ee_months_list = ee.ee_list.List.sequence(1, 12)
-
-    # Calculate monthly NDSI (Normalized Difference Snow Index) for the basin
-    ee_StatsByMonth_ic = ee.imagecollection.ImageCollection.fromImages(
-        ee_months_list.map(
-            lambda ee_month: sca_m_bna._ee_calc_month_xci_temporal_stats(
-                ee_month, ee_TACbyMonth_ic, ee_basin_fc
-            )
-        ).flatten()  # Flatten is added but might not be necessary
-    )
-
-    # ---------------------------------------------------------------------------------------------------------------------
-    # 5. Calculate SCA by elevation
-    # ---------------------------------------------------------------------------------------------------------------------
-
-    ee_SCAbyMonth_elev_fc = ee_StatsByMonth_ic.map(
+    ee_MergedByMonth_elev_fc = ee_StatsByMonth_ic.map(
         lambda ee_image: _ee_calc_month_spatial_mean_per_elev(
             ee_image,
             ee_dem_img,
             ee_basin_fc,
-            input_band_name="Snow_TAC_mean",
-            output_band_name="SCA",
+            input_band_names=["Snow_TAC_mean", "Cloud_TAC_mean"],
+            output_band_names=["SCA", "CCA"],
+            tile_scale=ee_tile_scale,
         )
     ).flatten()
 
-    # ---------------------------------------------------------------------------------------------------------------------
-    # 6. Calculate CCA by elevation
-    # ---------------------------------------------------------------------------------------------------------------------
-
-    ee_CCAbyMonth_elev_fc = ee_StatsByMonth_ic.map(
-        lambda ee_image: _ee_calc_month_spatial_mean_per_elev(
-            ee_image,
-            ee_dem_img,
-            ee_basin_fc,
-            input_band_name="Cloud_TAC_mean",
-            output_band_name="CCA",
-        )
-    ).flatten()
-
-    # ---------------------------------------------------------------------------------------------------------------------
-    # 8. Merge Month SCA and CCA collections
-    # ---------------------------------------------------------------------------------------------------------------------
-
-    ee_MergedByMonth_elev_fc = common._ee_merge_feature_collections(
-        ee_SCAbyMonth_elev_fc, ee_CCAbyMonth_elev_fc, primary_key="MonthElev"
-    )
-
     # Round values
     ee_MergedByMonth_elev_fc = common._ee_format_properties_2decimals(
         ee_MergedByMonth_elev_fc, ["SCA", "CCA"]
@@ -214,6 +181,11 @@ class SCA_M_Elev_BNA(common.BaseBasinStats):
     ):
         # lazy argument passing. Consider moving to explicit arguments
         args = {k: v for k, v in locals().items() if k != "self"}
+        # Monthly temporal stats don't depend on the basin, calculate them once for all basins
+        # Only the Snow and Cloud means are used, stdDev and percentiles are skipped
+        self.ee_month_stats_ic = sca_m_bna._ee_calc_month_temporal_stats_ic(
+            ee_icollection, include_std_dev=False, include_percentiles=False
+        )
         bands_of_interest = ["Month", "Elevation", "SCA", "CCA"]
         super().__init__(bands_of_interest=bands_of_interest, **args)
         self.ee_dem_img = ee_dem_img
@@ -224,7 +196,7 @@ class SCA_M_Elev_BNA(common.BaseBasinStats):
             basin_code,
             self.basins_cd_property,
             self.ee_basins_fc,
-            self.ee_icollection,
+            self.ee_month_stats_ic,
             self.ee_dem_img,
         )
 
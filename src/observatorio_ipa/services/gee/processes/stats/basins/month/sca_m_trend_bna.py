@@ -11,34 +11,33 @@ Adapted from the JavaScript implementation at users/observatorionieves/modules/E
 
 import ee
 from observatorio_ipa.services.gee.processes.stats import common, trend
-from observatorio_ipa.services.gee.processes.stats.basins.month import sca_m_bna
-from observatorio_ipa.core.defaults import DEFAULT_SCALE, DEFAULT_CHI_PROJECTION
+from observatorio_ipa.core.defaults import DEFAULT_SCALE
 
 
 def _ee_calc_month_sca_temporal_trend_stats(
     month: int | ee.ee_number.Number,
     ee_TACbyYearMonth_ic: ee.imagecollection.ImageCollection,
-    ee_basin_fc: ee.featurecollection.FeatureCollection,
 ) -> ee.image.Image:
     """Calculates Temporal trend statistics for a given month of the year (January, February, etc) from a time
-    series image collection and an area of interest (basin).
+    series image collection.
 
     This is a wrapper for trend._ee_calc_temporal_trend_stats to calculates statistics for a specific month.
 
-    The Time series ImageCollection is expected to be monthly images from multiple years. Images should include
-    a band named 'SCA'
+    The Time series ImageCollection is expected to be monthly images from multiple years with only the 'SCA' band.
     Returns a single image with a band sens_slopes with the Sen's slope values for the pixels that a
     a statistically significant trend under Mann-Kendall trend analysis (95% confidence interval, p_value <= 0.025)
+    and 0 elsewhere. The image is not clipped, spatial reductions are limited by the area of interest instead.
+    Months with less than 8 years of images return 0 slopes, the Mann-Kendall variance approximation does not hold for
+    shorter series.
 
     Args:
         month (int|ee.ee_number.Number): Integer between 1-12 indicating the month
-        ee_TACbyYearMonth_ic (ee.imagecollection.ImageCollection): ImageCollection with year/month timeseries
-        ee_basin_fc (ee.featurecollection.FeatureCollection): FeatureCollection with area or interest (basin)
+        ee_TACbyYearMonth_ic (ee.imagecollection.ImageCollection): ImageCollection with year/month timeseries (SCA band only)
 
     """
 
     # Selects all images from the same month across the years
-    ee_month_selected_ic = ee_TACbyYearMonth_ic.select("SCA").filter(
+    ee_month_selected_ic = ee_TACbyYearMonth_ic.filter(
         ee.filter.Filter.calendarRange(month, month, "month")
     )
 
@@ -59,20 +58,23 @@ def _ee_calc_month_sca_temporal_trend_stats(
     ee_sensSlope_img: ee.image.Image = ee_trend_stats_img.select("sens_slopes")
 
     # -----------------------------------------------------------------------------------------
-    # Create vectors of areas with significant trends
+    # Keep slopes only for areas with significant trends
     # ! Areas with significant trends could include both positive and negative trends.
-    # ! I don't see the purpose of this, why not just multiply the slope by significant_trend_img which is binary?
+    # significant_trend is self masked, so masking the slopes with it is equivalent to clipping them to the
+    # vectorized significant areas, without the raster to vector round trip.
     # -----------------------------------------------------------------------------------------
-    ee_vector_fc = ee_significant_trend_img.reduceToVectors(
-        geometry=ee_basin_fc,
-        scale=DEFAULT_SCALE,
-        crs=DEFAULT_CHI_PROJECTION,
-        geometryInNativeProjection=True,
-    )
-
-    # Clip Sens Slopes to only areas with significant trends
-    ee_significant_slopes_img = (
-        ee_sensSlope_img.clip(ee_vector_fc).unmask().clip(ee_basin_fc)
+    ee_significant_slopes_img = ee_sensSlope_img.updateMask(
+        ee_significant_trend_img
+    ).unmask(0)
+
+    # Skip the trend for short series (n < 8), the normal approximation used for p-values is not valid
+    ee_no_trend_img = ee.image.Image.constant(0).toFloat().rename("sens_slopes")
+    ee_significant_slopes_img = ee.image.Image(
+        ee.Algorithms.If(
+            ee_month_selected_ic.size().gte(8),
+            ee_significant_slopes_img,
+            ee_no_trend_img,
+        )
     )
 
     # ageReturn = ee.image.Image([unmasked_slope])
@@ -112,23 +114,22 @@ def _ee_calc_month_trend_per_basin(
     ee_basin_fc = ee_basins_fc.filter(
         ee.filter.Filter.eq(basins_cd_property, basin_code)
     )
+    ee_tile_scale = common._ee_get_tile_scale(ee_basin_fc)
 
     # ----------------------------------------------------------------------------------------------------------------------
     # SCI and CCI Correction
     # ----------------------------------------------------------------------------------------------------------------------
-    ee_TACbyYearMonth_ic = (
-        ee_icollection.map(
-            lambda ee_image: common._ee_correct_CCI_band(ee_image, "Cloud_TAC", "CP")
-        )
-        .map(
-            lambda ee_image: common._ee_correct_SCI_band(
-                ee_image, "Snow_TAC", "Cloud_TAC", "SP"
-            )
+    # Both corrections are applied in a single map to avoid an intermediate collection
+    ee_TACbyYearMonth_ic = ee_icollection.map(
+        lambda ee_image: common._ee_correct_SCI_band(
+            common._ee_correct_CCI_band(ee_image, "Cloud_TAC", "CP"),
+            "Snow_TAC",
+            "Cloud_TAC",
+            "SP",
         )
-        .select(
-            ["SP", "CP"], ["SCA", "CCA"]
-        )  # Rename SCA and CCA to keep below code as-is
-    )
+    ).select(
+        ["SP"], ["SCA"]
+    )  # Only SCA is used for the trend, select it once for all months
 
     # ----------------------------------------------------------------------------------------------------------------------
     # MONTH NON-PARAMETRIC TREND ANALYSIS
@@ -141,30 +142,50 @@ def _ee_calc_month_trend_per_basin(
     # Image Collection with one image per month (12 images). Only includes Slopes of pixels with significant trends
     ee_month_significant_slopes_ic = ee.imagecollection.ImageCollection.fromImages(
         month.map(
-            lambda m: _ee_calc_month_sca_temporal_trend_stats(
-                m, ee_TACbyYearMonth_ic, ee_basin_fc
-            )
-        ).flatten()
+            lambda m: _ee_calc_month_sca_temporal_trend_stats(m, ee_TACbyYearMonth_ic)
+        )  # Each month returns a single Image, no need to flatten
     )
 
     # ----------------------------------------------------------------------------------------------------------------------
     # SPATIAL REDUCTION
     # Reduce to single value for basin and consolidate results
+    # - Months are stacked as bands (named after the month number) so the basin is reduced once for all months
     # ----------------------------------------------------------------------------------------------------------------------
 
-    ee_month_significant_slopes_fc: ee.featurecollection.FeatureCollection = (
-        ee_month_significant_slopes_ic.map(
-            lambda ee_image: sca_m_bna._ee_calc_month_spatial_mean(
-                ee_image, ee_basin_fc, basins_cd_property
-            )
-        ).flatten()
+    ee_month_significant_slopes_img = ee_month_significant_slopes_ic.toBands().rename(
+        [str(m) for m in range(1, 13)]
     )
 
-    # Rename and Round values to two decimals
-    ee_month_significant_slopes_fc = ee_month_significant_slopes_fc.map(
-        lambda ee_feature: common._ee_copy_feature_property(ee_feature, "mean", "SCA")
+    ee_basin_means_fc = ee_month_significant_slopes_img.reduceRegions(
+        collection=ee_basin_fc.select([basins_cd_property]),
+        reducer=ee.reducer.Reducer.mean(),
+        scale=DEFAULT_SCALE,
+        tileScale=ee_tile_scale,
     )
 
+    def _ee_make_month_features(
+        ee_feature: ee.feature.Feature,
+    ) -> ee.featurecollection.FeatureCollection:
+        return ee.featurecollection.FeatureCollection(
+            month.map(
+                lambda m: ee.feature.Feature(
+                    None,
+                    {
+                        basins_cd_property: ee_feature.get(basins_cd_property),
+                        "Month": m,
+                        "SCA": ee_feature.get(
+                            ee.ee_number.Number(m).toInt().format("%d")
+                        ),
+                    },
+                )
+            )
+        )
+
+    ee_month_significant_slopes_fc = ee_basin_means_fc.map(
+        _ee_make_month_features
+    ).flatten()
+
+    # Round values to two decimals
     ee_month_significant_slopes_fc = common._ee_format_properties_2decimals(
         ee_month_significant_slopes_fc, ["SCA"]
     )
@@ -203,10 +224,20 @@ class SCA_M_Trend_BNA(common.BaseBasinStats):
         max_exports: int | None = None,
         **kwargs,
     ):
-        # lazy argument passing. Consider moving to explicit arguments
-        args = {k: v for k, v in locals().items() if k != "self"}
         bands_of_interest = ["Month", "SCA"]
-        super().__init__(bands_of_interest=bands_of_interest, **args)
+        super().__init__(
+            ee_icollection=ee_icollection,
+            ee_basins_fc=ee_basins_fc,
+            basins_cd_property=basins_cd_property,
+            export_target=export_target,
+            export_path=export_path,
+            table_prefix=table_prefix,
+            bands_of_interest=bands_of_interest,
+            storage_bucket=storage_bucket,
+            basin_codes=basin_codes,
+            exclude_basin_codes=exclude_basin_codes,
+            max_exports=max_exports,
+        )
 
     def stats_proc(self, basin_code) -> ee.featurecollection.FeatureCollection:
         # Implement snowline calculation logic here
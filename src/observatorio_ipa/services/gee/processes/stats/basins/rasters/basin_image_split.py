@@ -73,9 +73,9 @@ from observatorio_ipa.services.gee.processes.stats.common import BaseBasinRaster
 
 #             # Clip image to the basin geometry and reproject
 #             ee_clipped_img = (
-#                 ee_image.clip(ee_basin_geometry)
+#                 ee_image.toInt16()
+#                 .clip(ee_basin_geometry)
 #                 .reproject(crs=DEFAULT_CHI_PROJECTION, scale=DEFAULT_SCALE)
-#                 .toInt16()
 #             )
 
 #             export_opts = {
@@ -126,10 +126,21 @@ class SplitImagePerBasins(BaseBasinRasters):
         export_target: str,
         export_path: str,
         img_prefix: str,
+        storage_bucket: str | None = None,
         basin_codes: list[str] | None = None,
         exclude_basin_codes: list[str] | None = None,
         max_exports: int | None = None,
         **kwargs,
     ) -> None:
-        args = {k: v for k, v in locals().items() if k != "self"}
-        super().__init__(**args)
+        super().__init__(
+            ee_image=ee_image,
+            ee_basins_fc=ee_basins_fc,
+            basins_cd_property=basins_cd_property,
+            export_target=export_target,
+            export_path=export_path,
+            img_prefix=img_prefix,
+            storage_bucket=storage_bucket,
+            basin_codes=basin_codes,
+            exclude_basin_codes=exclude_basin_codes,
+            max_exports=max_exports,
+        )
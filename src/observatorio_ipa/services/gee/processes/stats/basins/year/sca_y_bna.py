@@ -18,6 +18,7 @@ def _ee_calc_year_spatial_mean(
     ee_image: ee.image.Image,
     ee_basin_fc: ee.featurecollection.FeatureCollection,
     region_property: str,
+    tile_scale: int | ee.ee_number.Number = 1,
 ) -> ee.featurecollection.FeatureCollection:
     """Calculates the spatial mean(s) for a every image in a Time Series ImageCollection with yearly images
 
@@ -29,12 +30,13 @@ def _ee_calc_year_spatial_mean(
         ee_image: Image with one or more bands and 'year' property
         ee_basin_fc: FeatureCollection with area of interest polygons
         region_property: Property from Area of Interest to keep in results
+        tile_scale: tileScale for the reduction (see common._ee_get_tile_scale). Default is 1.
     Returns:
         ee.featurecollection.FeatureCollection: FeatureCollection with mean values.
     """
 
     ee_region_mean_fc = common._ee_calc_spatial_mean(
-        ee_image, ee_basin_fc, region_property
+        ee_image, ee_basin_fc, region_property, tile_scale
     )
 
     def _ee_set_props(
@@ -75,24 +77,23 @@ def _ee_calc_year_basin_stats(
     ee_basin_fc = ee_basins_fc.filter(
         ee.filter.Filter.eq(basins_cd_property, basin_code)
     )
+    ee_tile_scale = common._ee_get_tile_scale(ee_basin_fc)
 
     # ------------------------------------------------------------------------------------------------------------------------------
     # Calculate snowline elevation
     # ------------------------------------------------------------------------------------------------------------------------------
 
-    ee_TACbyYear_ic = (
-        ee_icollection.map(
-            lambda ee_image: common._ee_correct_CCI_band(
-                ee_image, "Cloud_Persistence", "CP"
-            )
-        )
-        .map(
-            lambda ee_image: common._ee_correct_SCI_band(
-                ee_image, "Snow_Persistence", "Cloud_Persistence", "SP"
-            )
+    # Both corrections are applied in a single map to avoid an intermediate collection
+    ee_TACbyYear_ic = ee_icollection.map(
+        lambda ee_image: common._ee_correct_SCI_band(
+            common._ee_correct_CCI_band(ee_image, "Cloud_Persistence", "CP"),
+            "Snow_Persistence",
+            "Cloud_Persistence",
+            "SP",
         )
-        .select(["SP", "CP"])
-    )
+    ).select(
+        ["SP", "CP"], ["SCA", "CCA"]
+    )  # Rename before the reduction so means are already named SCA and CCA
 
     # ------------------------------------------------------------------------------------------------------------------------------
     # Reduce to single value per region
@@ -101,19 +102,11 @@ def _ee_calc_year_basin_stats(
     ee_year_basin_fc = ee.featurecollection.FeatureCollection(
         ee_TACbyYear_ic.map(
             lambda ee_image: _ee_calc_year_spatial_mean(
-                ee_image, ee_basin_fc, basins_cd_property
+                ee_image, ee_basin_fc, basins_cd_property, ee_tile_scale
             )
         ).flatten()
     )
 
-    # Copy and Rename properties
-    ee_year_basin_fc = ee_year_basin_fc.map(
-        lambda ee_feature: common._ee_copy_feature_property(ee_feature, "SP", "SCA")
-    )
-    ee_year_basin_fc = ee_year_basin_fc.map(
-        lambda ee_feature: common._ee_copy_feature_property(ee_feature, "CP", "CCA")
-    )
-
     # Format properties to 2 decimals
     ee_year_basin_fc = common._ee_format_properties_2decimals(
         ee_year_basin_fc, ["SCA", "CCA"]
@@ -154,10 +147,20 @@ class SCA_Y_BNA(common.BaseBasinStats):
         max_exports: int | None = None,
         **kwargs,
     ):
-        # lazy argument passing. Consider moving to explicit arguments
-        args = {k: v for k, v in locals().items() if k != "self"}
         bands_of_interest = ["Year", "SCA", "CCA"]
-        super().__init__(bands_of_interest=bands_of_interest, **args)
+        super().__init__(
+            ee_icollection=ee_icollection,
+            ee_basins_fc=ee_basins_fc,
+            basins_cd_property=basins_cd_property,
+            export_target=export_target,
+            export_path=export_path,
+            table_prefix=table_prefix,
+            bands_of_interest=bands_of_interest,
+            storage_bucket=storage_bucket,
+            basin_codes=basin_codes,
+            exclude_basin_codes=exclude_basin_codes,
+            max_exports=max_exports,
+        )
 
     def stats_proc(self, basin_code) -> ee.featurecollection.FeatureCollection:
         # Implement snowline calculation logic here
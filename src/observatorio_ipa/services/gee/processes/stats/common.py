@@ -162,69 +162,98 @@ def _ee_calc_SP_temporal_stats(
 
 def _ee_calc_cci_sci_temporal_stats(
     ee_icollection: ee.imagecollection.ImageCollection,
+    bands: list[str] | None = None,
+    include_std_dev: bool = True,
+    include_percentiles: bool = True,
 ) -> ee.image.Image:
     """Calculates Temporal pixel level statistics for Snow and Cloud across an Time Series Image collection.
 
-    Calculates pixel level mean and percentiles (p0, p25, p50, p75, p100) for Snow and Cloud. Requires 'Snow_TAC'
-    and 'Cloud_TAC' bands.
+    Calculates pixel level mean, stdDev and percentiles (p0, p5, p25, p50, p75, p90, p100) for Snow and Cloud.
+    Requires 'Snow_TAC' and 'Cloud_TAC' bands unless a subset of bands is given. Statistics that are not needed can
+    be skipped to avoid computing them.
 
-    Resulting image has the following bands Snow_mean, Cloud_mean, Snow_TAC_p0, Snow_TAC_p25, Snow_TAC_p50,
-    Snow_TAC_p75, Snow_TAC_p100, Cloud_TAC_p0, Cloud_TAC_p25, Cloud_TAC_p50, Cloud_TAC_p75, Cloud_TAC_p100,
-    and a property 'month' with the month number.
+    Resulting image has the following bands for each band: <band>_mean, <band>_stdDev, <band>_p0, <band>_p5,
+    <band>_p25, <band>_p50, <band>_p75, <band>_p90, <band>_p100 (e.g. Snow_TAC_mean, Cloud_TAC_p50).
 
     Args:
         ee_icollection: Time Series ImageCollection with Snow_TAC and Cloud_TAC bands.
+        bands: Bands to calculate statistics for. Defaults to ["Snow_TAC", "Cloud_TAC"].
+        include_std_dev: Whether to calculate stdDev.
+        include_percentiles: Whether to calculate percentiles.
     Returns:
         ee.image.Image: Image with pixel level statistics for Snow and Cloud for the given month.
 
     """
-    # TODO Move this to common.py. Consider making it generic to calc stats for one or more bands without hardcoding band names
+    if bands is None:
+        bands = ["Snow_TAC", "Cloud_TAC"]
 
     # Calculate mean pixel values for Snow and Cloud across years
     #  | TAC values are between 0-100, so a mean would result in a %, which is percent of times the pixel was covered
     #  | by snow or clouds in the same month across the years. Values should be between 0 and 100.
-    # Compute mean and stddev for Snow_TAC in one go
-    # Output bands: 'Snow_TAC_mean', 'Snow_TAC_stdDev'
-    ee_snow_stats_img: ee.image.Image = ee_icollection.select("Snow_TAC").reduce(
-        ee.reducer.Reducer.mean().combine(ee.reducer.Reducer.stdDev(), "", True)
-    )
-    # Compute mean and stddev for Cloud_TAC in one go
-    # Output bands: 'Cloud_TAC_mean', 'Cloud_TAC_stdDev'
-    ee_cloud_stats_img: ee.image.Image = ee_icollection.select("Cloud_TAC").reduce(
-        ee.reducer.Reducer.mean().combine(ee.reducer.Reducer.stdDev(), "", True)
+    # All statistics are computed for all bands in a single reduction, output band names are prefixed with the
+    # input band name (e.g. 'Snow_TAC_mean')
+    ee_reducer = ee.reducer.Reducer.mean()
+    if include_std_dev:
+        ee_reducer = ee_reducer.combine(ee.reducer.Reducer.stdDev(), "", True)
+    if include_percentiles:
+        ee_reducer = ee_reducer.combine(
+            ee.reducer.Reducer.percentile(
+                [0, 5, 25, 50, 75, 90, 100],
+                ["p0", "p5", "p25", "p50", "p75", "p90", "p100"],
+            ),
+            "",
+            True,
+        )
+
+    ee_consolidated_img: ee.image.Image = ee_icollection.select(bands).reduce(
+        ee_reducer
     )
 
-    # Calculate percentiles
-    ee_snow_percentiles_img: ee.image.Image = ee_icollection.select("Snow_TAC").reduce(
-        ee.reducer.Reducer.percentile(
-            [0, 5, 25, 50, 75, 90, 100],
-            ["p0", "p5", "p25", "p50", "p75", "p90", "p100"],
-        )
+    # An empty collection reduces to an image without bands, which breaks band selection downstream.
+    # Return a fully masked image with the expected bands instead, skipping the reduction.
+    stats_names = ["mean"]
+    if include_std_dev:
+        stats_names.append("stdDev")
+    if include_percentiles:
+        stats_names.extend(["p0", "p5", "p25", "p50", "p75", "p90", "p100"])
+    band_names = [f"{band}_{stat}" for band in bands for stat in stats_names]
+
+    ee_empty_img = (
+        ee.image.Image.constant([0] * len(band_names))
+        .rename(band_names)
+        .toFloat()
+        .updateMask(ee.image.Image.constant(0))
     )
-    ee_cloud_percentiles_img: ee.image.Image = ee_icollection.select(
-        "Cloud_TAC"
-    ).reduce(
-        ee.reducer.Reducer.percentile(
-            [0, 5, 25, 50, 75, 90, 100],
-            ["p0", "p5", "p25", "p50", "p75", "p90", "p100"],
-        )
+
+    return ee.image.Image(
+        ee.Algorithms.If(ee_icollection.size().gt(0), ee_consolidated_img, ee_empty_img)
     )
 
-    ee_consolidated_img = ee.image.Image(
-        [
-            ee_snow_stats_img,  # Bands: Snow_TAC_mean, Snow_TAC_stdDev
-            ee_cloud_stats_img,  # Bands: Cloud_TAC_mean, Cloud_TAC_stdDev
-            ee_snow_percentiles_img,
-            ee_cloud_percentiles_img,
-        ]
+
+def _ee_get_tile_scale(
+    ee_aoi_fc: ee.featurecollection.FeatureCollection,
+) -> ee.ee_number.Number:
+    """Choose a reduction tileScale based on the size of the area of interest.
+
+    Larger areas use smaller tiles to avoid running out of memory during reductions. bestEffort is not used since it
+    silently changes the scale (and results) of the reduction.
+
+    Args:
+        ee_aoi_fc (ee.featurecollection.FeatureCollection): FeatureCollection with area of interest (region or basin)
+    Returns:
+        ee.ee_number.Number: tileScale to use, 1 for areas < 1,000 km2, 4 for areas < 10,000 km2 and 16 otherwise.
+    """
+    ee_area = ee_aoi_fc.geometry(maxError=1000).area(maxError=1000)
+    return ee.ee_number.Number(
+        ee.Algorithms.If(ee_area.lt(1e9), 1, ee.Algorithms.If(ee_area.lt(1e10), 4, 16))
     )
-    return ee_consolidated_img
 
 
 def _ee_calc_spatial_mean(
     ee_image: ee.image.Image,
     ee_basin_fc: ee.featurecollection.FeatureCollection,
     region_property: str,
+    tile_scale: int | ee.ee_number.Number = 1,
 ) -> ee.featurecollection.FeatureCollection:
     """Calculate spatial mean value for all bands in the image within a given area of interest (basin).
 
@@ -235,6 +264,7 @@ def _ee_calc_spatial_mean(
         ee_image (ee.image.Image): Image to calculate mean for
         ee_basin_fc (ee.featurecollection.FeatureCollection): FeatureCollection with area of interest (region or basin)
         region_property (str): Property from Area of Interest to keep in results
+        tile_scale (int | ee.ee_number.Number): tileScale for the reduction (see _ee_get_tile_scale). Default is 1.
     Returns:
         ee.featurecollection.FeatureCollection: FeatureCollection with mean values per region
     """
@@ -244,6 +274,7 @@ def _ee_calc_spatial_mean(
         collection=ee_basin_fc.select([region_property]),
         reducer=ee.reducer.Reducer.mean(),
         scale=DEFAULT_SCALE,
+        tileScale=tile_scale,
     )
 
     def _ee_set_props(ee_feature: ee.feature.Feature, ee_image: ee.image.Image):
@@ -436,6 +467,31 @@ def _ee_copy_feature_property_across_fc(
     )
 
 
+def _get_basin_codes(
+    ee_basins_fc: ee.featurecollection.FeatureCollection, basins_cd_property: str
+) -> tuple:
+    """Get the list of unique basin codes in a FeatureCollection.
+
+    Not cached at module level, the app runs as a long-lived scheduler and the basins asset can change between
+    runs. Classes keep the result per instance instead (see _get_all_basin_codes).
+
+    args:
+        ee_basins_fc (ee.featurecollection.FeatureCollection): FeatureCollection with basin polygons
+        basins_cd_property (str): Name of the property that has basin codes
+    returns:
+        tuple: Unique basin codes in the FeatureCollection
+    """
+    # Deduplicate server-side, basins split in several features would otherwise be processed more than once
+    basin_code_list = (
+        ee_basins_fc.distinct([basins_cd_property])
+        .aggregate_array(basins_cd_property)
+        .getInfo()
+    )
+    if basin_code_list is None:
+        basin_code_list = []
+    return tuple(basin_code_list)
+
+
 def add_csv_suffix(file_path: str) -> str:
     """Add .csv suffix to the file name if not present."""
     path = Path(file_path)
@@ -459,6 +515,18 @@ class BaseStats(ABC):
     def calc_stats(self) -> None:
         pass
 
+    def _get_all_basin_codes(self) -> list[str]:
+        """Get all unique basin codes in the basins FeatureCollection.
+
+        Codes are requested from GEE once per instance and reused on later calls. New instances (e.g. on the next
+        scheduled run) request them again, so changes to the basins asset are picked up.
+        """
+        if not hasattr(self, "_all_basin_codes"):
+            self._all_basin_codes = _get_basin_codes(
+                self.ee_basins_fc, self.basins_cd_property
+            )
+        return list(self._all_basin_codes)
+
     def make_exports(self) -> ExportTaskList:
 
         if not hasattr(self, "stats"):
@@ -623,11 +691,7 @@ class BaseBasinStats(BaseStats):
         # TODO: Need to proactively skip exports that already exist in target path.
 
         # Get all unique basin codes
-        basin_code_list = self.ee_basins_fc.aggregate_array(
-            self.basins_cd_property
-        ).getInfo()
-        if basin_code_list is None:
-            basin_code_list = []
+        basin_code_list = self._get_all_basin_codes()
 
         # If basin_codes are explicitly provided
         if self.basin_codes:
@@ -723,11 +787,7 @@ class BaseNationalStats(BaseStats):
         # TODO: Need to proactively skip exports that already exist in target path.
 
         # Get all unique basin codes
-        basin_code_list = self.ee_basins_fc.aggregate_array(
-            self.basins_cd_property
-        ).getInfo()
-        if basin_code_list is None:
-            basin_code_list = []
+        basin_code_list = self._get_all_basin_codes()
 
         # If basin_codes are explicitly provided
         if self.basin_codes:
@@ -816,15 +876,23 @@ class BaseBasinRasters(ABC):
         self.exclude_basin_codes = exclude_basin_codes
         self.max_exports = max_exports
 
+    def _get_all_basin_codes(self) -> list[str]:
+        """Get all unique basin codes in the basins FeatureCollection.
+
+        Codes are requested from GEE once per instance and reused on later calls. New instances (e.g. on the next
+        scheduled run) request them again, so changes to the basins asset are picked up.
+        """
+        if not hasattr(self, "_all_basin_codes"):
+            self._all_basin_codes = _get_basin_codes(
+                self.ee_basins_fc, self.basins_cd_property
+            )
+        return list(self._all_basin_codes)
+
     def make_rasters(self) -> None:
         # TODO: Need to proactively skip exports that already exist in target path.
 
         # Get all unique basin codes
-        basin_code_list = self.ee_basins_fc.aggregate_array(
-            self.basins_cd_property
-        ).getInfo()
-        if basin_code_list is None:
-            basin_code_list = []
+        basin_code_list = self._get_all_basin_codes()
 
         # If basin_codes are explicitly provided
         if self.basin_codes:
@@ -847,6 +915,10 @@ class BaseBasinRasters(ABC):
         if not max_exports:
             max_exports = len(basin_code_list)
 
+        # Cast once for all basins and before reprojecting, so resampling works on 16-bit instead of float values.
+        # Reprojection uses nearest neighbour, so values are the same as casting afterwards.
+        ee_int16_img = self.ee_image.toInt16()
+
         self.rasters: list[dict] = []
         for basin_code in basin_code_list:
 
@@ -860,10 +932,8 @@ class BaseBasinRasters(ABC):
                 )
 
                 # Clip image to the basin geometry and reproject
-                ee_basin_img = (
-                    self.ee_image.clip(ee_basin_fc)
-                    .reproject(crs=DEFAULT_CHI_PROJECTION, scale=DEFAULT_SCALE)
-                    .toInt16()
+                ee_basin_img = ee_int16_img.clip(ee_basin_fc).reproject(
+                    crs=DEFAULT_CHI_PROJECTION, scale=DEFAULT_SCALE
                 )
 
                 # -----------------------------
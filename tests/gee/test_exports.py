@@ -0,0 +1,78 @@
+from observatorio_ipa.services.gee.exports import ExportTaskList
+
+
+def _add_task(export_tasks, mocker, name, task_status="CREATED", start_error=None):
+    ee_task = mocker.MagicMock()
+    if start_error:
+        ee_task.start.side_effect = start_error
+    export_tasks.add_task(
+        type="table",
+        name=name,
+        target="gdrive",
+        path="path/to/folder",
+        task=ee_task,
+        task_status=task_status,
+    )
+    return ee_task
+
+
+class TestStartExports:
+    def test_all_tasks_started(self, mocker):
+        export_tasks = ExportTaskList()
+        ee_tasks = [_add_task(export_tasks, mocker, f"table_{i}") for i in range(5)]
+
+        summary = export_tasks.start_exports()
+
+        assert summary == {"PENDING": 5}
+        for ee_task in ee_tasks:
+            ee_task.start.assert_called_once()
+        assert all(task.task_status == "SUBMITTED" for task in export_tasks)
+
+    def test_one_task_fails_to_start(self, mocker):
+        export_tasks = ExportTaskList()
+        _add_task(export_tasks, mocker, "table_ok_1")
+        _add_task(
+            export_tasks, mocker, "table_fail", start_error=Exception("Too many tasks")
+        )
+        _add_task(export_tasks, mocker, "table_ok_2")
+
+        summary = export_tasks.start_exports(max_workers=3)
+
+        assert summary == {"PENDING": 2, "FAILED": 1}
+        tasks = {task.name: task for task in export_tasks}
+        assert tasks["table_fail"].task_status == "FAILED_TO_START"
+        assert tasks["table_fail"].error == "Too many tasks"
+        assert tasks["table_ok_1"].task_status == "SUBMITTED"
+        assert tasks["table_ok_2"].task_status == "SUBMITTED"
+
+    def test_skips_tasks_not_pending_start(self, mocker):
+        export_tasks = ExportTaskList()
+        ee_started = _add_task(export_tasks, mocker, "table_new")
+        ee_completed = _add_task(
+            export_tasks, mocker, "table_done", task_status="COMPLETED"
+        )
+        ee_excluded = _add_task(
+            export_tasks, mocker, "table_exists", task_status="ALREADY_EXISTS"
+        )
+
+        summary = export_tasks.start_exports()
+
+        assert summary == {"PENDING": 1, "COMPLETED": 1, "EXCLUDED": 1}
+        ee_started.start.assert_called_once()
+        ee_completed.start.assert_not_called()
+        ee_excluded.start.assert_not_called()
+
+    def test_task_list_not_modified(self, mocker):
+        export_tasks = ExportTaskList()
+        for i in range(10):
+            _add_task(export_tasks, mocker, f"table_{i}")
+        ids_before = [task.id for task in export_tasks]
+
+        export_tasks.start_exports(max_workers=4)
+
+        assert [task.id for task in export_tasks] == ids_before
+        assert len(export_tasks) == 10
+
+    def test_no_tasks(self):
+        export_tasks = ExportTaskList()
+        assert export_tasks.start_exports() == {}
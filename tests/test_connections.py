@@ -0,0 +1,36 @@
+import pytest
+from observatorio_ipa.services.connections import GEE_HIGH_VOLUME_URL, connect_to_gee
+
+
+@pytest.fixture
+def service_account(mocker):
+    service_account_ = mocker.MagicMock()
+    service_account_.service_user = "user@project.iam.gserviceaccount.com"
+    service_account_.credentials = {
+        "client_email": "user@project.iam.gserviceaccount.com"
+    }
+    service_account_.project_id = "project"
+    return service_account_
+
+
+class TestConnectToGee:
+    @pytest.fixture(autouse=True)
+    def mock_credentials(self, mocker):
+        mocker.patch("observatorio_ipa.services.connections.ServiceAccountCredentials")
+
+    def test_default_endpoint(self, mocker, service_account):
+        mock_initialize = mocker.patch(
+            "observatorio_ipa.services.connections.ee.Initialize"
+        )
+        connect_to_gee(service_account)
+        mock_initialize.assert_called_once()
+        assert mock_initialize.call_args.kwargs["url"] is None
+
+    def test_high_volume_endpoint(self, mocker, service_account):
+        mock_initialize = mocker.patch(
+            "observatorio_ipa.services.connections.ee.Initialize"
+        )
+        connect_to_gee(service_account, use_high_volume_endpoint=True)
+        mock_initialize.assert_called_once()
+        assert mock_initialize.call_args.kwargs["url"] == GEE_HIGH_VOLUME_URL
+        assert mock_initialize.call_args.kwargs["project"] == "project"